@@ -1,5 +1,12 @@
 
 # basic algorithms for testing purposes
+import numpy as np
+
+from numeric_sort import as_numeric_array, counting_sort_array
+
+# Ranges up to this size are finished with insertion sort by intro_sort and bottom_up_merge_sort
+INSERTION_SORT_THRESHOLD = 16
+
 def linear_search(arr, target):
     """
     Perform a linear search for the target in the array.
@@ -94,6 +101,110 @@ def quick_sort(arr):
     right = [x for x in arr if x > pivot]
     return quick_sort(left) + middle + quick_sort(right)
 
+def intro_sort(arr, key=None):
+    """
+    Sort the array in place with introsort: quick sort with a median-of-three
+    pivot that switches to heap sort on ranges that recurse too deeply, and to
+    insertion sort on small ranges. Uses an explicit stack, so adversarial input
+    can neither hit the recursion limit nor degrade to quadratic time.
+    Not stable unless a key is given.
+    
+    :param arr: List of elements to sort.
+    :param key: Optional function computing the sort key of each element; the
+        keys are computed once and ties keep their original order.
+    :return: The same list, sorted.
+    """
+    items = _decorate(arr, key)
+    n = len(items)
+    if n > 1:
+        stack = [(0, n - 1, 2 * n.bit_length())]
+        while stack:
+            lo, hi, depth = stack.pop()
+            while hi - lo >= INSERTION_SORT_THRESHOLD:
+                if depth == 0:
+                    _heap_sort_range(items, lo, hi)
+                    break
+                depth -= 1
+                
+                # Median of three: order items[lo], items[mid], items[hi] and pivot on the middle one
+                mid = (lo + hi) // 2
+                if items[mid] < items[lo]:
+                    items[lo], items[mid] = items[mid], items[lo]
+                if items[hi] < items[mid]:
+                    items[mid], items[hi] = items[hi], items[mid]
+                    if items[mid] < items[lo]:
+                        items[lo], items[mid] = items[mid], items[lo]
+                pivot = items[mid]
+                
+                # Hoare partition into [lo, j] <= pivot <= [j + 1, hi]
+                i, j = lo - 1, hi + 1
+                while True:
+                    i += 1
+                    while items[i] < pivot:
+                        i += 1
+                    j -= 1
+                    while pivot < items[j]:
+                        j -= 1
+                    if i >= j:
+                        break
+                    items[i], items[j] = items[j], items[i]
+                
+                # Continue with the smaller side, defer the larger one
+                if j - lo < hi - j:
+                    stack.append((j + 1, hi, depth))
+                    hi = j
+                else:
+                    stack.append((lo, j, depth))
+                    lo = j + 1
+            else:
+                _insertion_sort_range(items, lo, hi)
+    return _undecorate(arr, items, key)
+
+def _decorate(arr, key):
+    """Return arr itself, or a list of (key, index, element) triples when a key function is given."""
+    if key is None:
+        return arr
+    return [(key(value), index, value) for index, value in enumerate(arr)]
+
+def _undecorate(arr, items, key):
+    """Write the sorted elements back into arr and return it."""
+    if key is not None:
+        arr[:] = [value for _, _, value in items]
+    return arr
+
+def _insertion_sort_range(items, lo, hi):
+    """Insertion sort of items[lo:hi + 1] in place."""
+    for i in range(lo + 1, hi + 1):
+        value = items[i]
+        j = i - 1
+        while j >= lo and value < items[j]:
+            items[j + 1] = items[j]
+            j -= 1
+        items[j + 1] = value
+
+def _heap_sort_range(items, lo, hi):
+    """Heap sort of items[lo:hi + 1] in place, with an iterative sift-down."""
+    n = hi - lo + 1
+    for start in range(n // 2 - 1, -1, -1):
+        _sift_down_range(items, lo, start, n)
+    for end in range(n - 1, 0, -1):
+        items[lo], items[lo + end] = items[lo + end], items[lo]
+        _sift_down_range(items, lo, 0, end)
+
+def _sift_down_range(items, lo, i, n):
+    """Restore the max-heap property below position i of the heap stored in items[lo:lo + n]."""
+    value = items[lo + i]
+    child = 2 * i + 1
+    while child < n:
+        if child + 1 < n and items[lo + child] < items[lo + child + 1]:
+            child += 1
+        if not value < items[lo + child]:
+            break
+        items[lo + i] = items[lo + child]
+        i = child
+        child = 2 * i + 1
+    items[lo + i] = value
+
 def merge_sort(arr):
     """
     Perform merge sort on the array.
@@ -133,26 +244,73 @@ def merge(left, right):
     
     return result
 
+def bottom_up_merge_sort(arr, key=None):
+    """
+    Stable merge sort without recursion or per-merge allocations: runs of
+    INSERTION_SORT_THRESHOLD elements are insertion-sorted, then merged in
+    passes of doubling width, alternating between the list and one buffer.
+    
+    :param arr: List of elements to sort.
+    :param key: Optional function computing the sort key of each element (computed once per element).
+    :return: The same list, sorted.
+    """
+    items = _decorate(arr, key)
+    n = len(items)
+    width = INSERTION_SORT_THRESHOLD
+    for lo in range(0, n, width):
+        _insertion_sort_range(items, lo, min(lo + width, n) - 1)
+    
+    source, target = items, [None] * n if n > width else items
+    while width < n:
+        for lo in range(0, n, 2 * width):
+            mid = min(lo + width, n)
+            hi = min(lo + 2 * width, n)
+            i, j, k = lo, mid, lo
+            if mid < hi and not source[mid] < source[mid - 1]:
+                # Already in order: copy the pair of runs as is
+                target[lo:hi] = source[lo:hi]
+                continue
+            while i < mid and j < hi:
+                if source[j] < source[i]:
+                    target[k] = source[j]
+                    j += 1
+                else:
+                    target[k] = source[i]
+                    i += 1
+                k += 1
+            if i < mid:
+                target[k:hi] = source[i:mid]
+            else:
+                target[k:hi] = source[j:hi]
+        source, target = target, source
+        width *= 2
+    
+    if source is not items:
+        items[:] = source
+    return _undecorate(arr, items, key)
+
 def heapify(arr, n, i):
     """
     Helper function to maintain the heap property.
     
+    Sifts the element at i down iteratively: larger children move up one
+    level each and the element is written once at its final position.
+    
     :param arr: List of elements to heapify.
     :param n: Size of the heap.
     :param i: Index of the element to heapify.
     """
-    largest = i
-    left = 2 * i + 1
-    right = 2 * i + 2
-    
-    if left < n and arr[left] > arr[largest]:
-        largest = left
-    if right < n and arr[right] > arr[largest]:
-        largest = right
-        
-    if largest != i:
-        arr[i], arr[largest] = arr[largest], arr[i]
-        heapify(arr, n, largest)
+    value = arr[i]
+    child = 2 * i + 1
+    while child < n:
+        if child + 1 < n and arr[child + 1] > arr[child]:
+            child += 1
+        if not arr[child] > value:
+            break
+        arr[i] = arr[child]
+        i = child
+        child = 2 * i + 1
+    arr[i] = value
         
 def heap_sort(arr):
     """
@@ -178,10 +336,19 @@ def counting_sort(arr, max_val):
     """
     Perform counting sort on the array.
     
+    Homogeneous integer input (a list of ints or a NumPy integer array) is
+    counted with np.bincount and expanded with np.repeat; other input goes
+    through the element-by-element loop.
+    
     :param arr: List of elements to sort.
     :param max_val: Maximum value in the array.
-    :return: Sorted list of elements.
+    :return: Sorted list of elements (a NumPy array for NumPy input).
     """
+    values = as_numeric_array(arr)
+    if values is not None and values.dtype.kind in 'iu':
+        result = counting_sort_array(values, 0, max_val)
+        return result if isinstance(arr, np.ndarray) else result.tolist()
+    
     count = [0] * (max_val + 1)
     output = [0] * len(arr)
     
@@ -212,6 +379,9 @@ if __name__ == "__main__":
     print("Quick Sort:", quick_sort(arr.copy()))
     print("Merge Sort:", merge_sort(arr.copy()))
     print("Heap Sort:", heap_sort(arr.copy()))
+    print("Intro Sort:", intro_sort(arr.copy()))
+    print("Bottom-up Merge Sort:", bottom_up_merge_sort(arr.copy()))
+    print("Intro Sort by last digit:", intro_sort(arr.copy(), key=lambda x: x % 10))
     
     target = 22
     print("Linear Search for", target, ":", linear_search(arr, target))
@@ -1,10 +1,75 @@
 """
 Day Counter Program
 This program provides various functions to count days in different scenarios.
+
+Run without arguments for a demonstration, or pass a CSV/JSON Lines file of
+(start, end) date pairs ('-' for stdin) to stream a day-span report:
+
+    python day_counter.py spans.csv --percentiles 50,95
 """
 
 from datetime import datetime, date, timedelta
+from collections import Counter
+from itertools import chain, islice
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
+import argparse
 import calendar
+import csv
+import json
+import math
+import sys
+
+import numpy as np
+
+DAY_NAMES = np.array(['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday'])
+
+# Weekend flags, Monday first (Saturday and Sunday are weekend days)
+WEEKEND_MASK = (False, False, False, False, False, True, True)
+
+# Maximum number of distinct date strings kept by the shared parser cache
+PARSE_CACHE_SIZE = 8192
+
+
+def parse_date(value):
+    """
+    Convert a date argument to a datetime.date, parsing strings through a shared LRU cache.
+    
+    :param value: Date (datetime.date or string in 'YYYY-MM-DD' format)
+    :return: datetime.date (non-string values are returned unchanged)
+    """
+    if isinstance(value, str):
+        return _parse_date_string(value)
+    return value
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _parse_date_string(value):
+    """
+    Parse a 'YYYY-MM-DD' string, using date.fromisoformat for the strict form.
+    
+    :param value: Date string
+    :return: datetime.date
+    """
+    if len(value) == 10 and value[4] == '-' and value[7] == '-':
+        return date.fromisoformat(value)
+    return datetime.strptime(value, '%Y-%m-%d').date()
+
+
+def parse_cache_info():
+    """
+    Get hit/miss statistics of the shared date parser cache.
+    
+    :return: Named tuple with hits, misses, maxsize and currsize
+    """
+    return _parse_date_string.cache_info()
+
+
+def clear_parse_cache():
+    """
+    Empty the shared date parser cache and reset its statistics.
+    """
+    _parse_date_string.cache_clear()
 
 
 def days_between_dates(start_date, end_date):
@@ -15,10 +80,8 @@ def days_between_dates(start_date, end_date):
     :param end_date: End date (datetime.date or string in 'YYYY-MM-DD' format)
     :return: Number of days between the dates
     """
-    if isinstance(start_date, str):
-        start_date = datetime.strptime(start_date, '%Y-%m-%d').date()
-    if isinstance(end_date, str):
-        end_date = datetime.strptime(end_date, '%Y-%m-%d').date()
+    start_date = parse_date(start_date)
+    end_date = parse_date(end_date)
     
     delta = end_date - start_date
     return abs(delta.days)
@@ -31,8 +94,7 @@ def days_until_date(target_date):
     :param target_date: Target date (datetime.date or string in 'YYYY-MM-DD' format)
     :return: Number of days until the target date (negative if date has passed)
     """
-    if isinstance(target_date, str):
-        target_date = datetime.strptime(target_date, '%Y-%m-%d').date()
+    target_date = parse_date(target_date)
     
     today = date.today()
     delta = target_date - today
@@ -46,8 +108,7 @@ def days_since_date(past_date):
     :param past_date: Past date (datetime.date or string in 'YYYY-MM-DD' format)
     :return: Number of days since the past date
     """
-    if isinstance(past_date, str):
-        past_date = datetime.strptime(past_date, '%Y-%m-%d').date()
+    past_date = parse_date(past_date)
     
     today = date.today()
     delta = today - past_date
@@ -85,60 +146,87 @@ def is_leap_year(year):
     return calendar.isleap(year)
 
 
-def count_weekdays_between_dates(start_date, end_date):
+def count_weekdays_between_dates(start_date, end_date, holidays=None, weekend_mask=WEEKEND_MASK):
     """
     Count the number of weekdays (Monday-Friday) between two dates.
     
+    Full weeks are counted in closed form and only the remainder is inspected,
+    so the cost does not depend on the length of the range.
+    
     :param start_date: Start date (datetime.date or string in 'YYYY-MM-DD' format)
     :param end_date: End date (datetime.date or string in 'YYYY-MM-DD' format)
-    :return: Number of weekdays between the dates
+    :param holidays: Optional sorted sequence of datetime.date holidays to exclude (see holiday_calendar)
+    :param weekend_mask: Seven flags, Monday first, marking which days are weekend days
+    :return: Number of weekdays between the dates (both ends included)
     """
-    if isinstance(start_date, str):
-        start_date = datetime.strptime(start_date, '%Y-%m-%d').date()
-    if isinstance(end_date, str):
-        end_date = datetime.strptime(end_date, '%Y-%m-%d').date()
+    start_date = parse_date(start_date)
+    end_date = parse_date(end_date)
     
     # Ensure start_date is before end_date
     if start_date > end_date:
         start_date, end_date = end_date, start_date
     
-    weekdays = 0
-    current_date = start_date
+    workday_mask = [not is_weekend for is_weekend in weekend_mask]
+    weekdays = _count_masked_days(start_date, end_date, workday_mask)
     
-    while current_date <= end_date:
-        if current_date.weekday() < 5:  # Monday=0, Sunday=6
-            weekdays += 1
-        current_date += timedelta(days=1)
+    if holidays:
+        lo = bisect_left(holidays, start_date)
+        hi = bisect_right(holidays, end_date)
+        weekdays -= sum(1 for holiday in holidays[lo:hi] if workday_mask[holiday.weekday()])
     
     return weekdays
 
 
-def count_weekends_between_dates(start_date, end_date):
+def count_weekends_between_dates(start_date, end_date, weekend_mask=WEEKEND_MASK):
     """
     Count the number of weekend days (Saturday-Sunday) between two dates.
     
     :param start_date: Start date (datetime.date or string in 'YYYY-MM-DD' format)
     :param end_date: End date (datetime.date or string in 'YYYY-MM-DD' format)
-    :return: Number of weekend days between the dates
+    :param weekend_mask: Seven flags, Monday first, marking which days are weekend days
+    :return: Number of weekend days between the dates (both ends included)
     """
-    if isinstance(start_date, str):
-        start_date = datetime.strptime(start_date, '%Y-%m-%d').date()
-    if isinstance(end_date, str):
-        end_date = datetime.strptime(end_date, '%Y-%m-%d').date()
+    start_date = parse_date(start_date)
+    end_date = parse_date(end_date)
     
     # Ensure start_date is before end_date
     if start_date > end_date:
         start_date, end_date = end_date, start_date
     
-    weekends = 0
-    current_date = start_date
+    return _count_masked_days(start_date, end_date, weekend_mask)
+
+
+def _count_masked_days(start_date, end_date, mask):
+    """
+    Count the days between two ordered dates (inclusive) whose weekday is set in mask.
+    
+    :param start_date: Start date (datetime.date)
+    :param end_date: End date (datetime.date), not before start_date
+    :param mask: Seven flags, Monday first
+    :return: Number of matching days
+    """
+    full_weeks, remainder = divmod((end_date - start_date).days + 1, 7)
+    count = full_weeks * sum(1 for flag in mask if flag)
+    
+    first_weekday = start_date.weekday()
+    for offset in range(remainder):
+        if mask[(first_weekday + offset) % 7]:
+            count += 1
     
-    while current_date <= end_date:
-        if current_date.weekday() >= 5:  # Saturday=5, Sunday=6
-            weekends += 1
-        current_date += timedelta(days=1)
+    return count
+
+
+def holiday_calendar(holidays):
+    """
+    Build a sorted, de-duplicated holiday calendar for the weekday counting functions.
     
-    return weekends
+    :param holidays: Iterable of holidays (datetime.date or strings in 'YYYY-MM-DD' format)
+    :return: Sorted tuple of datetime.date holidays
+    """
+    parsed = set()
+    for holiday in holidays:
+        parsed.add(parse_date(holiday))
+    return tuple(sorted(parsed))
 
 
 def age_in_days(birth_date):
@@ -148,8 +236,7 @@ def age_in_days(birth_date):
     :param birth_date: Birth date (datetime.date or string in 'YYYY-MM-DD' format)
     :return: Age in days
     """
-    if isinstance(birth_date, str):
-        birth_date = datetime.strptime(birth_date, '%Y-%m-%d').date()
+    birth_date = parse_date(birth_date)
     
     today = date.today()
     delta = today - birth_date
@@ -164,8 +251,7 @@ def add_days_to_date(start_date, days_to_add):
     :param days_to_add: Number of days to add (can be negative to subtract)
     :return: New date after adding the days
     """
-    if isinstance(start_date, str):
-        start_date = datetime.strptime(start_date, '%Y-%m-%d').date()
+    start_date = parse_date(start_date)
     
     new_date = start_date + timedelta(days=days_to_add)
     return new_date
@@ -178,13 +264,376 @@ def get_day_of_week(input_date):
     :param input_date: Date (datetime.date or string in 'YYYY-MM-DD' format)
     :return: Day of the week as string
     """
-    if isinstance(input_date, str):
-        input_date = datetime.strptime(input_date, '%Y-%m-%d').date()
+    input_date = parse_date(input_date)
     
     days = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
     return days[input_date.weekday()]
 
 
+def to_datetime64(dates):
+    """
+    Convert a batch of dates to a NumPy datetime64[D] array.
+    
+    :param dates: Array or iterable of dates (datetime.date or strings in 'YYYY-MM-DD' format)
+    :return: NumPy array of dtype datetime64[D]
+    """
+    if isinstance(dates, np.ndarray) and dates.dtype == 'datetime64[D]':
+        return dates
+    if not isinstance(dates, (np.ndarray, list, tuple, str)):
+        dates = list(dates)
+    converted = np.asarray(dates, dtype='datetime64[D]')
+    _validate_datetime64(dates, converted)
+    return converted
+
+
+# Range of datetime.date, which parse_date returns
+_MIN_DATE = np.datetime64('0001-01-01', 'D')
+_MAX_DATE = np.datetime64('9999-12-31', 'D')
+
+
+def _validate_datetime64(dates, converted):
+    """
+    Hold a batch conversion to the same contract as parse_date.
+    
+    NumPy also accepts '', 'NaT', 'today' and partial dates such as '2025' or
+    '2025-01', and years outside 1..9999; raise ValueError for any string that is
+    not a full 10-character 'YYYY-MM-DD' date, for any NaT that did not come
+    from a NaT input and for any date datetime.date cannot represent.
+    
+    :param dates: The values passed to to_datetime64
+    :param converted: Their datetime64[D] conversion
+    """
+    if isinstance(dates, np.ndarray) and dates.dtype.kind == 'U':
+        if dates.size and (np.char.str_len(dates) != 10).any():
+            bad = dates.reshape(-1)[np.char.str_len(dates.reshape(-1)) != 10][0]
+            raise ValueError(f"time data {str(bad)!r} does not match format '%Y-%m-%d'")
+        values, flat = None, converted.reshape(-1)
+    else:
+        if converted.ndim == 1 and not isinstance(dates, np.ndarray):
+            values, flat = dates, converted
+        else:
+            values, flat = np.asarray(dates, dtype=object).reshape(-1), converted.reshape(-1)
+        types = set(map(type, values))
+        unsupported = types - {str, date, datetime, np.datetime64}
+        if unsupported:
+            raise ValueError(f"Invalid date type {unsupported.pop().__name__}")
+        strings = values if types == {str} else [value for value in values if isinstance(value, str)]
+        if set(map(len, strings)) - {10}:
+            bad = next(value for value in strings if len(value) != 10)
+            raise ValueError(f"time data {str(bad)!r} does not match format '%Y-%m-%d'")
+    
+    for i in np.flatnonzero(np.isnat(flat)).tolist():
+        value = None if values is None else values[i]
+        if not (isinstance(value, np.datetime64) and np.isnat(value)):
+            raise ValueError(f"Invalid date {value!r}" if values is not None else "Invalid date 'NaT'")
+    # datetime.date stops at years 1 and 9999, NumPy does not ('0000-01-01', '-001-01-01')
+    outside = np.flatnonzero((flat < _MIN_DATE) | (flat > _MAX_DATE))
+    if outside.size:
+        value = flat[outside[0]] if values is None else values[outside[0]]
+        raise ValueError(f"Date {str(value)!r} is out of range")
+
+
+def days_between_dates_batch(start_dates, end_dates):
+    """
+    Calculate the number of days between pairs of dates in one vectorized pass.
+    
+    :param start_dates: Array or iterable of start dates (datetime.date or 'YYYY-MM-DD' strings)
+    :param end_dates: Array or iterable of end dates (datetime.date or 'YYYY-MM-DD' strings)
+    :return: NumPy int64 array with the number of days between each pair
+    """
+    delta = to_datetime64(end_dates) - to_datetime64(start_dates)
+    if np.isnat(delta).any():
+        raise ValueError("Cannot count days between missing (NaT) dates")
+    return np.abs(delta.astype(np.int64))
+
+
+def add_days_to_date_batch(start_dates, days_to_add):
+    """
+    Add a number of days to each date in a batch.
+    
+    :param start_dates: Array or iterable of start dates (datetime.date or 'YYYY-MM-DD' strings)
+    :param days_to_add: Number of days to add, either a single integer or one per date
+    :return: NumPy datetime64[D] array of the new dates
+    """
+    offsets = np.asarray(days_to_add, dtype=np.int64).astype('timedelta64[D]')
+    return to_datetime64(start_dates) + offsets
+
+
+def get_day_of_week_batch(dates):
+    """
+    Get the day of the week for each date in a batch.
+    
+    :param dates: Array or iterable of dates (datetime.date or 'YYYY-MM-DD' strings)
+    :return: NumPy array of day names
+    """
+    return DAY_NAMES[weekday_index_batch(dates)]
+
+
+def weekday_index_batch(dates):
+    """
+    Get the weekday index (Monday=0, Sunday=6) for each date in a batch.
+    
+    :param dates: Array or iterable of dates (datetime.date or 'YYYY-MM-DD' strings)
+    :return: NumPy int64 array of weekday indices
+    """
+    # 1970-01-01 (day 0 of datetime64) was a Thursday, i.e. weekday 3
+    return (to_datetime64(dates).astype(np.int64) + 3) % 7
+
+
+def count_weekdays_batch(start_dates, end_dates, holidays=None, weekend_mask=WEEKEND_MASK):
+    """
+    Count weekdays between pairs of dates in one vectorized pass (like numpy.busday_count).
+    
+    :param start_dates: Array or iterable of start dates (datetime.date or 'YYYY-MM-DD' strings)
+    :param end_dates: Array or iterable of end dates (datetime.date or 'YYYY-MM-DD' strings)
+    :param holidays: Optional iterable of holidays to exclude
+    :param weekend_mask: Seven flags, Monday first, marking which days are weekend days
+    :return: NumPy int64 array with the number of weekdays in each range (both ends included)
+    """
+    workday_mask = [not is_weekend for is_weekend in weekend_mask]
+    return _busday_count_inclusive(start_dates, end_dates, workday_mask, holidays)
+
+
+def count_weekends_batch(start_dates, end_dates, weekend_mask=WEEKEND_MASK):
+    """
+    Count weekend days between pairs of dates in one vectorized pass.
+    
+    :param start_dates: Array or iterable of start dates (datetime.date or 'YYYY-MM-DD' strings)
+    :param end_dates: Array or iterable of end dates (datetime.date or 'YYYY-MM-DD' strings)
+    :param weekend_mask: Seven flags, Monday first, marking which days are weekend days
+    :return: NumPy int64 array with the number of weekend days in each range (both ends included)
+    """
+    return _busday_count_inclusive(start_dates, end_dates, list(weekend_mask), None)
+
+
+def _busday_count_inclusive(start_dates, end_dates, mask, holidays):
+    """
+    Run numpy.busday_count over ordered, inclusive ranges.
+    
+    :param start_dates: Array or iterable of start dates
+    :param end_dates: Array or iterable of end dates
+    :param mask: Seven flags, Monday first, marking the days to count
+    :param holidays: Optional iterable of days to skip
+    :return: NumPy int64 array of counts
+    """
+    starts = to_datetime64(start_dates)
+    ends = to_datetime64(end_dates)
+    lower = np.minimum(starts, ends)
+    upper = np.maximum(starts, ends) + np.timedelta64(1, 'D')
+    
+    if not any(mask):
+        return np.zeros(np.broadcast(lower, upper).shape, dtype=np.int64)
+    if holidays is None:
+        holidays = []
+    return np.busday_count(lower, upper, weekmask=[bool(flag) for flag in mask],
+                           holidays=to_datetime64(holidays)).astype(np.int64)
+
+
+class SpanStatistics:
+    """
+    Running aggregates over day spans with memory bounded by the number of distinct spans.
+    """
+    
+    def __init__(self):
+        self.count = 0
+        self.total = 0
+        self.minimum = None
+        self.maximum = None
+        self.histogram = Counter()
+    
+    def update(self, spans):
+        """
+        Add a batch of day spans to the aggregates.
+        
+        :param spans: NumPy integer array (or list) of day spans
+        """
+        spans = np.asarray(spans, dtype=np.int64)
+        if spans.size == 0:
+            return
+        self.count += int(spans.size)
+        self.total += int(spans.sum())
+        low, high = int(spans.min()), int(spans.max())
+        self.minimum = low if self.minimum is None else min(self.minimum, low)
+        self.maximum = high if self.maximum is None else max(self.maximum, high)
+        values, counts = np.unique(spans, return_counts=True)
+        self.histogram.update(dict(zip(values.tolist(), counts.tolist())))
+    
+    @property
+    def mean(self):
+        """Average span, or None if no spans were added."""
+        return self.total / self.count if self.count else None
+    
+    def percentile(self, q):
+        """
+        Get the exact q-th percentile (nearest-rank) of the spans seen so far.
+        
+        :param q: Percentile between 0 and 100
+        :return: Span at the requested percentile, or None if no spans were added
+        """
+        if not self.count:
+            return None
+        rank = max(1, math.ceil(self.count * q / 100))
+        seen = 0
+        for value in sorted(self.histogram):
+            seen += self.histogram[value]
+            if seen >= rank:
+                return value
+        return self.maximum
+    
+    def summary(self, percentiles=(50, 90, 99)):
+        """
+        Get the aggregates as a dictionary.
+        
+        :param percentiles: Percentiles to include
+        :return: Dictionary with count, sum, mean, min, max and the requested percentiles
+        """
+        result = {
+            'count': self.count,
+            'sum': self.total,
+            'mean': self.mean,
+            'min': self.minimum,
+            'max': self.maximum,
+        }
+        for q in percentiles:
+            result[f'p{q:g}'] = self.percentile(q)
+        return result
+
+
+def read_date_pairs(stream, input_format='csv', start_field='start', end_field='end'):
+    """
+    Lazily read (start, end) date string pairs from CSV or JSON Lines.
+    
+    CSV input may start with a header naming start_field and end_field, otherwise
+    the first two columns are used. JSON Lines records are read by key.
+    
+    :param stream: Text stream to read from
+    :param input_format: 'csv' or 'jsonl'
+    :param start_field: Column name or JSON key holding the start date
+    :param end_field: Column name or JSON key holding the end date
+    :return: Generator of (start, end) tuples; fields of malformed records or
+        missing columns are None, so they come out as invalid spans
+    """
+    if input_format == 'jsonl':
+        for line in stream:
+            if line.strip():
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    record = None
+                if not isinstance(record, dict):
+                    yield None, None
+                    continue
+                yield record.get(start_field), record.get(end_field)
+        return
+    
+    rows = csv.reader(stream)
+    first = next(rows, None)
+    if first is None:
+        return
+    start_index, end_index = 0, 1
+    if start_field in first and end_field in first:
+        start_index, end_index = first.index(start_field), first.index(end_field)
+    else:
+        rows = chain([first], rows)
+    for row in rows:
+        if row:
+            start = row[start_index].strip() if start_index < len(row) else None
+            end = row[end_index].strip() if end_index < len(row) else None
+            yield start, end
+
+
+def chunked(iterable, size):
+    """
+    Split an iterable into lists of at most size items.
+    
+    :param iterable: Iterable to split
+    :param size: Maximum chunk length
+    :return: Generator of lists
+    """
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def iter_span_chunks(pairs, chunk_size=65536):
+    """
+    Compute day spans for a stream of date pairs, one chunk at a time.
+    
+    Each chunk goes through days_between_dates_batch; a chunk with a malformed
+    or missing date is retried row by row with days_between_dates so bad rows
+    can be skipped.
+    
+    :param pairs: Iterable of (start, end) date pairs
+    :param chunk_size: Number of pairs per chunk
+    :return: Generator of (chunk, spans) where spans holds None for invalid rows
+    """
+    for chunk in chunked(pairs, chunk_size):
+        starts = [start for start, _ in chunk]
+        ends = [end for _, end in chunk]
+        try:
+            spans = days_between_dates_batch(starts, ends).tolist()
+        except ValueError:
+            spans = []
+            for start, end in chunk:
+                try:
+                    spans.append(days_between_dates(start, end))
+                except (ValueError, TypeError, AttributeError):
+                    spans.append(None)
+        yield chunk, spans
+
+
+def span_report(argv=None):
+    """
+    Command-line entry point: stream date pairs and report per-row spans and aggregates.
+    
+    :param argv: Argument list (defaults to sys.argv[1:])
+    :return: Process exit code
+    """
+    parser = argparse.ArgumentParser(
+        description="Report the number of days between (start, end) date pairs read from CSV or JSON Lines.")
+    parser.add_argument('input', nargs='?', default='-', help="Input file, or '-' for stdin (default)")
+    parser.add_argument('--format', choices=['csv', 'jsonl'], help="Input format (default: from file extension, else csv)")
+    parser.add_argument('--start-field', default='start', help="CSV column or JSON key of the start date")
+    parser.add_argument('--end-field', default='end', help="CSV column or JSON key of the end date")
+    parser.add_argument('--chunk-size', type=int, default=65536, help="Number of rows processed per chunk")
+    parser.add_argument('--percentiles', default='50,90,99', help="Comma-separated percentiles to report")
+    parser.add_argument('--no-rows', action='store_true', help="Only print the aggregates")
+    args = parser.parse_args(argv)
+    
+    input_format = args.format
+    if input_format is None:
+        input_format = 'jsonl' if args.input.endswith(('.jsonl', '.ndjson')) else 'csv'
+    percentiles = [float(q) for q in args.percentiles.split(',') if q.strip()]
+    
+    stream = sys.stdin if args.input == '-' else open(args.input, 'r', newline='')
+    summary_out = sys.stdout if args.no_rows else sys.stderr
+    stats = SpanStatistics()
+    invalid = 0
+    try:
+        writer = None if args.no_rows else csv.writer(sys.stdout, lineterminator='\n')
+        if writer:
+            writer.writerow(['start', 'end', 'days'])
+        pairs = read_date_pairs(stream, input_format, args.start_field, args.end_field)
+        for chunk, spans in iter_span_chunks(pairs, args.chunk_size):
+            valid = [span for span in spans if span is not None]
+            invalid += len(spans) - len(valid)
+            stats.update(valid)
+            if writer:
+                writer.writerows((start, end, '' if span is None else span)
+                                 for (start, end), span in zip(chunk, spans))
+    finally:
+        if stream is not sys.stdin:
+            stream.close()
+    
+    summary = stats.summary(percentiles)
+    summary['invalid'] = invalid
+    print(json.dumps(summary), file=summary_out)
+    return 0
+
+
 def display_calendar_month(year, month):
     """
     Display a calendar for a specific month and year.
@@ -243,45 +692,19 @@ def main():
     print(f"Date 100 days ago: {past_date}")
     print()
     
+    # Batch date arithmetic
+    starts = ["2025-05-19", "2025-03-14", "2025-04-14"]
+    ends = ["2025-07-07", "2025-05-26", "2025-05-28"]
+    print(f"Batch days between {starts} and {ends}: {days_between_dates_batch(starts, ends)}")
+    print(f"Batch day of week for {starts}: {get_day_of_week_batch(starts)}")
+    print()
+    
     # Display current month calendar
     print("Current month calendar:")
     print(display_calendar_month(current_year, current_month))
 
 
 if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        sys.exit(span_report())
     main()
-
-
-# Calculate days for each date pair
-day_counts = []
-
-result1 = days_between_dates("2025-05-19", "2025-07-07")
-print(f"Days between 2025-05-19 and 2025-07-07: {result1}")
-day_counts.append(result1)
-
-result2 = days_between_dates("2025-03-14", "2025-05-26")
-print(f"Days between 2025-03-14 and 2025-05-26: {result2}")
-day_counts.append(result2)
-
-result3 = days_between_dates("2025-03-15", "2025-05-27")
-print(f"Days between 2025-03-15 and 2025-05-27: {result3}")
-day_counts.append(result3)
-
-result4 = days_between_dates("2025-04-14", "2025-05-28")
-print(f"Days between 2025-04-14 and 2025-05-28: {result4}")
-day_counts.append(result4)
-
-result5 = days_between_dates("2025-02-27", "2025-05-28")
-print(f"Days between 2025-02-27 and 2025-05-28: {result5}")
-day_counts.append(result5)
-
-result6 = days_between_dates("2025-04-03", "2025-06-02")
-print(f"Days between 2025-04-03 and 2025-06-02: {result6}")
-day_counts.append(result6)
-
-# Calculate and display the average
-average_days = sum(day_counts) / len(day_counts)
-print(f"\nAll day counts: {day_counts}")
-print(f"Total days: {sum(day_counts)}")
-print(f"Number of calculations: {len(day_counts)}")
-print(f"Average days: {average_days:.2f}")
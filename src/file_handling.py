@@ -1,81 +1,628 @@
 # file handling
 import os
 import json
+import atexit
+import marshal
+import math
+import pickle
+import stat
+import sys
+import threading
+import time
+import uuid
+from collections import OrderedDict, namedtuple
+from contextlib import contextmanager
+from types import MappingProxyType
 from datetime import datetime, timedelta
-def read_json_file(file_path):
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+@contextmanager
+def atomic_write(file_path, mode='w', encoding=None, fsync=True):
+    """
+    Write a file atomically: the content goes to a temporary file in the same
+    directory, which is fsynced and then moved over the target with os.replace.
+    A crash mid-write leaves the previous version of the file intact.
+    
+    :param file_path: Path to the file to write
+    :param mode: 'w' for text or 'wb' for bytes
+    :param encoding: Text encoding (platform default if None)
+    :param fsync: If True, fsync the data and the directory entry before returning
+    :return: Context manager yielding the open temporary file
+    """
+    directory = os.path.dirname(os.path.abspath(file_path))
+    temp_path = os.path.join(directory, f".{os.path.basename(file_path)}.{uuid.uuid4().hex}.tmp")
+    try:
+        with open(temp_path, mode.replace('w', 'x'), encoding=encoding) as file:
+            yield file
+            file.flush()
+            if fsync:
+                os.fsync(file.fileno())
+        if os.path.exists(file_path):
+            os.chmod(temp_path, stat.S_IMODE(os.stat(file_path).st_mode))
+        os.replace(temp_path, file_path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+    if fsync:
+        _fsync_directory(directory)
+
+def _fsync_directory(directory):
+    """
+    Flush a directory entry to disk so a completed rename survives a crash (POSIX only).
+    
+    :param directory: Path to the directory
+    """
+    if os.name != 'posix':
+        return
+    fd = os.open(directory, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+ReadCacheInfo = namedtuple('ReadCacheInfo', ['hits', 'misses', 'evictions', 'files', 'bytes'])
+
+class FileReadCache:
+    """
+    Read-through cache of parsed file contents.
+    
+    Entries are keyed by path and loader and validated on every lookup against
+    the file's (mtime, size, inode), so a hit costs one os.stat call. Files
+    replaced through atomic_write always get a new inode. Least recently used
+    entries are evicted once the cached results add up to more than max_bytes,
+    as measured by the sizeof function passed to get() (a recursive
+    sys.getsizeof estimate of the result by default).
+    """
+    
+    def __init__(self, max_bytes=64 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self._cache = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    def get(self, file_path, loader, sizeof=None):
+        """
+        Return loader(file_path), reusing the cached result while the file is unchanged.
+        
+        :param file_path: Path to the file
+        :param loader: Function reading and parsing the file; its result is shared between callers
+        :param sizeof: Function returning the memory a result holds in bytes; defaults to
+            a recursive sys.getsizeof estimate
+        :return: The (possibly cached) result of the loader
+        """
+        try:
+            status = os.stat(file_path)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"The file {file_path} does not exist.") from None
+        signature = (status.st_mtime_ns, status.st_size, status.st_ino)
+        key = (file_path, loader)
+        
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is not None and entry[0] == signature:
+                self.hits += 1
+                self._cache.move_to_end(key)
+                return entry[1]
+            self.misses += 1
+        
+        # Loading after the stat means a concurrent change only makes the entry stale, never wrong
+        value = loader(file_path)
+        size = (_estimate_size if sizeof is None else sizeof)(value)
+        with self._lock:
+            previous = self._cache.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous[2]
+            if size <= self.max_bytes:
+                self._cache[key] = (signature, value, size)
+                self._bytes += size
+                while self._bytes > self.max_bytes:
+                    _, (_, _, evicted_size) = self._cache.popitem(last=False)
+                    self._bytes -= evicted_size
+                    self.evictions += 1
+        return value
+    
+    def invalidate(self, file_path):
+        """Drop every cached entry for a file."""
+        with self._lock:
+            for key in [key for key in self._cache if key[0] == file_path]:
+                self._bytes -= self._cache.pop(key)[2]
+    
+    def cache_info(self):
+        """Return hit/miss/eviction counters and the current cache size."""
+        return ReadCacheInfo(self.hits, self.misses, self.evictions, len(self._cache), self._bytes)
+    
+    def clear(self):
+        """Drop every cached entry and reset the statistics."""
+        with self._lock:
+            self._cache.clear()
+            self._bytes = 0
+            self.hits = self.misses = self.evictions = 0
+
+def _estimate_size(value):
+    """
+    Estimate the memory held by parsed file data: sys.getsizeof of the value plus,
+    for containers (including the read-only views from frozen reads), that of
+    every key and item. Objects shared between several places are counted each time.
+    
+    :param value: Parsed data
+    :return: Estimated size in bytes
+    """
+    if isinstance(value, MappingProxyType):
+        # The proxy itself is small; count the dictionary it wraps by its length
+        size = sys.getsizeof(value) + sys.getsizeof(dict.fromkeys(value))
+        return size + sum(_estimate_size(key) + _estimate_size(item) for key, item in value.items())
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        return size + sum(_estimate_size(key) + _estimate_size(item) for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return size + sum(_estimate_size(item) for item in value)
+    return size
+
+def _snapshot_size(snapshot):
+    """Size of a (loads, blob) pair from Serializer.load_snapshot: only the blob is held."""
+    return len(snapshot[1])
+
+# Shared cache used by read_json_file and read_text_file with cached=True
+read_cache = FileReadCache()
+
+def read_cache_info():
+    """Return the statistics of the shared read cache."""
+    return read_cache.cache_info()
+
+def clear_read_cache():
+    """Empty the shared read cache."""
+    read_cache.clear()
+
+class Serializer:
+    """
+    A file format for read_json_file, write_json_file and append_to_json_file.
+    
+    :param name: Name the serializer is registered under
+    :param dumps: Function encoding data to str or bytes
+    :param loads: Function decoding the bytes read from a file
+    """
+    
+    def __init__(self, name, dumps, loads):
+        self.name = name
+        self.dumps = dumps
+        self.loads = loads
+    
+    def __repr__(self):
+        return f"Serializer({self.name!r})"
+    
+    def load(self, file_path):
+        """Read and decode a file."""
+        with open(file_path, 'rb') as file:
+            return self.loads(file.read())
+    
+    def dump(self, file_path, data):
+        """Encode data and write it to a file atomically."""
+        content = self.dumps(data)
+        if isinstance(content, str):
+            content = content.encode('utf-8')
+        with atomic_write(file_path, 'wb') as file:
+            file.write(content)
+    
+    def load_frozen(self, file_path):
+        """Read a file as a read-only view (used by the read cache)."""
+        return _freeze_json(self.load(file_path))
+    
+    def load_snapshot(self, file_path):
+        """
+        Read a file as a (loads, blob) pair that restores a fresh copy of the data.
+        marshal restores plain data several times faster than json.loads; pickle
+        covers anything marshal cannot encode.
+        """
+        data = self.load(file_path)
+        try:
+            return marshal.loads, marshal.dumps(data)
+        except ValueError:
+            return pickle.loads, pickle.dumps(data, pickle.HIGHEST_PROTOCOL)
+
+def _freeze_json(value):
+    """Turn parsed data into a read-only view: dicts become mappingproxies and lists tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze_json(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze_json(item) for item in value)
+    return value
+
+_compact_encoder = json.JSONEncoder(separators=(',', ':'), ensure_ascii=False)
+
+def _orjson_dumps(data):
+    try:
+        content = orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+    except TypeError:
+        # orjson rejects integers beyond 64 bits and a few other inputs the stdlib accepts
+        return _compact_encoder.encode(data)
+    if b'null' in content and _has_non_finite(data):
+        # orjson writes NaN and infinities as null; the stdlib keeps them as NaN and Infinity
+        return _compact_encoder.encode(data)
+    return content
+
+def _orjson_loads(content):
+    try:
+        return orjson.loads(content)
+    except orjson.JSONDecodeError:
+        # Files holding NaN or Infinity, written by the stdlib fallback of _orjson_dumps
+        return json.loads(content)
+
+def _has_non_finite(value):
+    """Return True if parsed data contains a NaN or infinite float."""
+    if isinstance(value, float):
+        return not math.isfinite(value)
+    if isinstance(value, dict):
+        return any(_has_non_finite(item) for item in value.values())
+    if isinstance(value, (list, tuple)):
+        return any(_has_non_finite(item) for item in value)
+    return False
+
+SERIALIZERS = {}
+
+def register_serializer(serializer):
+    """
+    Make a serializer available by name.
+    
+    :param serializer: Serializer instance
+    """
+    SERIALIZERS[serializer.name] = serializer
+
+def get_serializer(serializer=None):
+    """
+    Look up a serializer.
+    
+    :param serializer: Serializer instance, registered name, or None for default_serializer
+    :return: Serializer instance
+    """
+    if isinstance(serializer, Serializer):
+        return serializer
+    name = default_serializer if serializer is None else serializer
+    if name not in SERIALIZERS:
+        raise ValueError(f"Unknown serializer {name}. Available serializers: {', '.join(sorted(SERIALIZERS))}.")
+    return SERIALIZERS[name]
+
+# Pretty-printed stdlib JSON, compact stdlib JSON and the trusted-data binary formats are always available
+register_serializer(Serializer('json', lambda data: json.dumps(data, indent=4), json.loads))
+register_serializer(Serializer('compact', _compact_encoder.encode, json.loads))
+register_serializer(Serializer('marshal', marshal.dumps, marshal.loads))
+register_serializer(Serializer('pickle', lambda data: pickle.dumps(data, pickle.HIGHEST_PROTOCOL), pickle.loads))
+if orjson is not None:
+    register_serializer(Serializer('orjson', _orjson_dumps, _orjson_loads))
+if msgpack is not None:
+    register_serializer(Serializer('msgpack', lambda data: msgpack.packb(data, use_bin_type=True),
+                                   lambda content: msgpack.unpackb(content, raw=False, strict_map_key=False)))
+# 'fast' is compact JSON through the quickest available encoder
+register_serializer(Serializer('fast', *((_orjson_dumps, _orjson_loads) if orjson is not None
+                                        else (_compact_encoder.encode, json.loads))))
+
+# Serializer used when none is given; 'json' keeps the original indented output
+default_serializer = 'json'
+
+def read_json_file(file_path, cached=False, frozen=False, serializer=None):
     """
     Read a JSON file and return its content as a dictionary.
     
     :param file_path: Path to the JSON file
+    :param cached: If True, go through the shared read cache and only re-parse the file when it changed
+    :param frozen: If True, return a read-only view (mappingproxies and tuples) instead of
+        plain dicts and lists; cached frozen reads are shared, so they skip the per-call copy
+    :param serializer: Serializer or its name (see SERIALIZERS); only use marshal and pickle for trusted files
     :return: Dictionary containing the JSON data
     """
+    serializer = get_serializer(serializer)
+    if cached:
+        if frozen:
+            return read_cache.get(file_path, serializer.load_frozen)
+        loads, blob = read_cache.get(file_path, serializer.load_snapshot, _snapshot_size)
+        return loads(blob)
+    
     if not os.path.exists(file_path):
         raise FileNotFoundError(f"The file {file_path} does not exist.")
     
-    with open(file_path, 'r') as file:
-        data = json.load(file)
-    
-    return data
+    data = serializer.load(file_path)
+    return _freeze_json(data) if frozen else data
 
-def write_json_file(file_path, data):
+def write_json_file(file_path, data, serializer=None):
     """
     Write a dictionary to a JSON file.
     
     :param file_path: Path to the JSON file
     :param data: Dictionary to write to the file
+    :param serializer: Serializer or its name (see SERIALIZERS)
     """
-    with open(file_path, 'w') as file:
-        json.dump(data, file, indent=4)
+    get_serializer(serializer).dump(file_path, data)
         
-def append_to_json_file(file_path, data):
+def append_to_json_file(file_path, data, serializer=None):
     """
     Append a dictionary to a JSON file.
     
     :param file_path: Path to the JSON file
     :param data: Dictionary to append to the file
+    :param serializer: Serializer or its name (see SERIALIZERS)
     """
     if not os.path.exists(file_path):
         raise FileNotFoundError(f"The file {file_path} does not exist.")
     
-    with open(file_path, 'r+') as file:
-        existing_data = json.load(file)
-        existing_data.update(data)
-        file.seek(0)
-        json.dump(existing_data, file, indent=4)
-        file.truncate()
+    serializer = get_serializer(serializer)
+    existing_data = serializer.load(file_path)
+    existing_data.update(data)
+    serializer.dump(file_path, existing_data)
         
-def read_text_file(file_path):
+def iter_jsonl_file(file_path):
+    """
+    Lazily read a JSON Lines file, one record per line.
+    
+    :param file_path: Path to the JSON Lines file
+    :return: Generator of the decoded records (blank lines are skipped)
+    """
+    if not os.path.exists(file_path):
+        raise FileNotFoundError(f"The file {file_path} does not exist.")
+    
+    with open(file_path, 'r', encoding='utf-8') as file:
+        for line in file:
+            if line.strip():
+                yield json.loads(line)
+
+def read_jsonl_file(file_path):
+    """
+    Read a JSON Lines file and return its records as a list.
+    
+    :param file_path: Path to the JSON Lines file
+    :return: List of records
+    """
+    return list(iter_jsonl_file(file_path))
+
+def write_jsonl_file(file_path, records):
+    """
+    Write an iterable of records to a JSON Lines file, replacing its content.
+    
+    :param file_path: Path to the JSON Lines file
+    :param records: Iterable of JSON-serializable records
+    """
+    encode = json.JSONEncoder(separators=(',', ':'), ensure_ascii=False).encode
+    with atomic_write(file_path, encoding='utf-8') as file:
+        file.writelines(encode(record) + '\n' for record in records)
+
+def append_to_jsonl_file(file_path, record):
+    """
+    Append one record to a JSON Lines file without reading the existing content.
+    
+    :param file_path: Path to the JSON Lines file (created if missing)
+    :param record: JSON-serializable record to append
+    """
+    with open(file_path, 'a', encoding='utf-8') as file:
+        file.write(json.dumps(record, separators=(',', ':'), ensure_ascii=False) + '\n')
+
+class JsonLinesWriter:
+    """
+    Buffered appender for JSON Lines files.
+    
+    Records are encoded as they arrive and written in batches of batch_size
+    lines. With fsync_interval set, a flush also fsyncs the file if that many
+    seconds have passed since the last fsync. Use as a context manager, or call
+    close(), so the last batch is written.
+    """
+    
+    def __init__(self, file_path, batch_size=1000, fsync_interval=None, mode='a'):
+        """
+        :param file_path: Path to the JSON Lines file (created if missing)
+        :param batch_size: Number of records buffered before they are written
+        :param fsync_interval: Minimum seconds between fsyncs, or None to never fsync
+        :param mode: 'a' to append to the file or 'w' to replace it
+        """
+        self.file_path = file_path
+        self.batch_size = batch_size
+        self.fsync_interval = fsync_interval
+        self.file = open(file_path, mode, encoding='utf-8')
+        self.buffer = []
+        self.last_fsync = time.monotonic()
+        self._encode = json.JSONEncoder(separators=(',', ':'), ensure_ascii=False).encode
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def write(self, record):
+        """
+        Buffer one record, writing the batch out once it is full.
+        
+        :param record: JSON-serializable record
+        """
+        self.buffer.append(self._encode(record))
+        if len(self.buffer) >= self.batch_size:
+            self.flush()
+    
+    def write_many(self, records):
+        """
+        Buffer several records.
+        
+        :param records: Iterable of JSON-serializable records
+        """
+        for record in records:
+            self.write(record)
+    
+    def flush(self, fsync=False):
+        """
+        Write the buffered records to the file.
+        
+        :param fsync: If True, fsync the file regardless of fsync_interval
+        """
+        if self.buffer:
+            self.buffer.append('')
+            self.file.write('\n'.join(self.buffer))
+            self.buffer = []
+        self.file.flush()
+        now = time.monotonic()
+        if fsync or (self.fsync_interval is not None and now - self.last_fsync >= self.fsync_interval):
+            os.fsync(self.file.fileno())
+            self.last_fsync = now
+    
+    def close(self):
+        """Flush the remaining records (fsyncing if fsync_interval is set) and close the file."""
+        if self.file.closed:
+            return
+        try:
+            self.flush(fsync=self.fsync_interval is not None)
+        finally:
+            self.file.close()
+        
+def read_text_file(file_path, cached=False):
     """
     Read a text file and return its content as a string.
     
     :param file_path: Path to the text file
+    :param cached: If True, go through the shared read cache and only re-read the file when it changed
     :return: String containing the text file content
     """
+    # Make pending buffered appends visible first
+    if file_path in _append_buffers:
+        _append_buffers[file_path].flush()
+    
+    if cached:
+        return read_cache.get(file_path, _load_text)
+    
     if not os.path.exists(file_path):
         raise FileNotFoundError(f"The file {file_path} does not exist.")
     
+    return _load_text(file_path)
+
+def _load_text(file_path):
     with open(file_path, 'r') as file:
-        content = file.read()
-    
-    return content
+        return file.read()
 
 def write_text_file(file_path, content):
     """Write a string to a text file.
     :param file_path: Path to the text file
     :param content: String to write to the file
     """
-    with open(file_path, 'w') as file:
+    if file_path in _append_buffers:
+        _append_buffers.pop(file_path).close()
+    with atomic_write(file_path) as file:
         file.write(content)
         
-def append_to_text_file(file_path, content):
+def append_to_text_file(file_path, content, buffered=False):
     """
     Append a string to a text file.
     
     :param file_path: Path to the text file
     :param content: String to append to the file
+    :param buffered: If True, coalesce the append in a shared TextAppendBuffer for
+        the file; call flush_text_buffers() or close_text_buffers() to write it out
     """
+    if buffered:
+        buffer = _append_buffers.get(file_path)
+        if buffer is None:
+            buffer = _append_buffers[file_path] = TextAppendBuffer(file_path)
+        buffer.append(content)
+        return
+    if file_path in _append_buffers:
+        _append_buffers[file_path].flush()
     with open(file_path, 'a') as file:
         file.write(content)
+
+class TextAppendBuffer:
+    """
+    Write-behind buffer that turns many small appends into large sequential writes.
+    
+    Appended strings are held in memory until buffer_size characters have
+    accumulated, then written in one call. flush() writes the pending data (and
+    fsyncs on request); close() flushes and closes the file. Data still buffered
+    when the process crashes is lost, so flush at the points that must be durable.
+    """
+    
+    def __init__(self, file_path, buffer_size=1024 * 1024):
+        """
+        :param file_path: Path to the text file (created if missing)
+        :param buffer_size: Number of characters buffered before a write
+        """
+        self.file_path = file_path
+        self.buffer_size = buffer_size
+        self.file = open(file_path, 'a')
+        self.pending = []
+        self.pending_size = 0
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
+    def append(self, content):
+        """
+        Buffer a string, writing the buffer out once it is full.
+        
+        :param content: String to append to the file
+        """
+        self.pending.append(content)
+        self.pending_size += len(content)
+        if self.pending_size >= self.buffer_size:
+            self.flush()
+    
+    def flush(self, fsync=False):
+        """
+        Write the buffered strings to the file.
+        
+        :param fsync: If True, also fsync the file
+        """
+        if self.pending:
+            self.file.write(''.join(self.pending))
+            self.pending = []
+            self.pending_size = 0
+        self.file.flush()
+        if fsync:
+            os.fsync(self.file.fileno())
+    
+    def close(self, fsync=False):
+        """
+        Flush the buffer and close the file.
+        
+        :param fsync: If True, fsync the file before closing it
+        """
+        if self.file.closed:
+            return
+        try:
+            self.flush(fsync)
+        finally:
+            self.file.close()
+
+# Shared buffers used by append_to_text_file(..., buffered=True), keyed by path
+_append_buffers = {}
+
+def flush_text_buffers(fsync=False):
+    """
+    Write out every pending buffered append_to_text_file call.
+    
+    :param fsync: If True, also fsync each file
+    """
+    for buffer in _append_buffers.values():
+        buffer.flush(fsync)
+
+def close_text_buffers(fsync=False):
+    """
+    Flush and close every shared append buffer.
+    
+    :param fsync: If True, fsync each file before closing it
+    """
+    while _append_buffers:
+        _, buffer = _append_buffers.popitem()
+        buffer.close(fsync)
+
+atexit.register(close_text_buffers)
         
 def file_exists(file_path):
     """
@@ -93,11 +640,7 @@ def get_file_modification_time(file_path):
     :param file_path: Path to the file
     :return: Last modification time as a datetime object
     """
-    if not os.path.exists(file_path):
-        raise FileNotFoundError(f"The file {file_path} does not exist.")
-    
-    mod_time = os.path.getmtime(file_path)
-    return datetime.fromtimestamp(mod_time)
+    return datetime.fromtimestamp(get_file_stat(file_path).mtime)
 
 def get_file_size(file_path):
     """
@@ -106,10 +649,133 @@ def get_file_size(file_path):
     :param file_path: Path to the file
     :return: Size of the file in bytes
     """
-    if not os.path.exists(file_path):
+    return get_file_stat(file_path).size
+
+FileStat = namedtuple('FileStat', ['name', 'size', 'mtime', 'is_file'])
+
+def _file_stat(name, status):
+    return FileStat(name, status.st_size, status.st_mtime, stat.S_ISREG(status.st_mode))
+
+class StatCache:
+    """
+    Short-lived cache of FileStat records, so repeated checks of the same path
+    within ttl seconds do not touch the filesystem. Missing paths are cached too.
+    
+    Entries are kept in the order they expire, so expired ones are dropped from
+    the front whenever a record is stored; max_entries caps the size on top of
+    that by dropping the oldest records first.
+    """
+    
+    def __init__(self, ttl=1.0, max_entries=100000):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._cache = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+    
+    def __len__(self):
+        return len(self._cache)
+    
+    def get(self, file_path):
+        """Return the FileStat of a path, or None if it does not exist."""
+        now = time.monotonic()
+        entry = self._cache.get(file_path)
+        if entry is not None and entry[0] > now:
+            self.hits += 1
+            return entry[1]
+        self.misses += 1
+        try:
+            record = _file_stat(file_path, os.stat(file_path))
+        except (FileNotFoundError, NotADirectoryError):
+            record = None
+        self._store(file_path, record, now)
+        return record
+    
+    def put(self, record):
+        """Store a record obtained elsewhere, e.g. from scan_directory."""
+        self._store(record.name, record, time.monotonic())
+    
+    def clear(self):
+        """Drop every cached record."""
+        self._cache.clear()
+    
+    def _store(self, file_path, record, now):
+        """Store a record at the end of the expiry order and drop expired and surplus entries."""
+        cache = self._cache
+        cache.pop(file_path, None)
+        cache[file_path] = (now + self.ttl, record)
+        while cache and (next(iter(cache.values()))[0] <= now or len(cache) > self.max_entries):
+            cache.popitem(last=False)
+
+def get_file_stat(file_path, cache=None):
+    """
+    Get the size, modification time and type of a file with a single stat call.
+    
+    :param file_path: Path to the file
+    :param cache: Optional StatCache to consult first
+    :return: FileStat(name, size, mtime, is_file) record, mtime being a POSIX timestamp
+    """
+    if cache is not None:
+        record = cache.get(file_path)
+    else:
+        try:
+            record = _file_stat(file_path, os.stat(file_path))
+        except (FileNotFoundError, NotADirectoryError):
+            record = None
+    if record is None:
         raise FileNotFoundError(f"The file {file_path} does not exist.")
+    return record
+
+def stat_paths(paths, cache=None):
+    """
+    Get metadata for many paths with one stat call each.
     
-    return os.path.getsize(file_path)
+    :param paths: Iterable of paths
+    :param cache: Optional StatCache to consult first
+    :return: List of FileStat records, with None for paths that do not exist
+    """
+    if cache is not None:
+        return [cache.get(file_path) for file_path in paths]
+    records = []
+    for file_path in paths:
+        try:
+            records.append(_file_stat(file_path, os.stat(file_path)))
+        except (FileNotFoundError, NotADirectoryError):
+            records.append(None)
+    return records
+
+def scan_directory(directory_path, recursive=False, cache=None):
+    """
+    Lazily list a directory with os.scandir, which gets entry types from the
+    directory listing itself, so each entry costs at most one stat call.
+    
+    :param directory_path: Path to the directory
+    :param recursive: If True, descend into subdirectories (symlinked directories are not followed)
+    :param cache: Optional StatCache to fill with the records
+    :return: Generator of FileStat records for files and directories; name is the entry path
+    """
+    if not os.path.isdir(directory_path):
+        raise FileNotFoundError(f"The directory {directory_path} does not exist.")
+    
+    pending = [directory_path]
+    while pending:
+        try:
+            entries = os.scandir(pending.pop())
+        except (FileNotFoundError, NotADirectoryError, PermissionError):
+            # Subdirectories may vanish or be unreadable mid-scan
+            continue
+        with entries:
+            for entry in entries:
+                try:
+                    record = _file_stat(entry.path, entry.stat())
+                except FileNotFoundError:
+                    # Removed since the listing, or a dangling symlink
+                    continue
+                if cache is not None:
+                    cache.put(record)
+                if recursive and not record.is_file and entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
+                yield record
 
 def delete_file(file_path):
     """
@@ -138,6 +804,20 @@ if __name__ == "__main__":
     updated_data = read_json_file(json_file)
     print(f"Updated JSON Data: {updated_data}")
     
+    # Repeated reads of an unchanged file come from the read cache
+    for _ in range(3):
+        config = read_json_file(json_file, cached=True, frozen=True)
+    print(f"Cached JSON Data: {dict(config)}, {read_cache_info()}")
+    
+    # Append records to a JSON Lines file and stream them back
+    jsonl_file = 'data.jsonl'
+    with JsonLinesWriter(jsonl_file, mode='w') as writer:
+        writer.write({'name': 'Alice', 'age': 30})
+        writer.write({'name': 'Bob', 'age': 25})
+    append_to_jsonl_file(jsonl_file, {'name': 'Carol', 'age': 41})
+    for record in iter_jsonl_file(jsonl_file):
+        print(f"JSON Lines record: {record}")
+    
     # Write to text file
     write_text_file(text_file, "Hello, World!")
     
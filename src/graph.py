@@ -1,24 +1,273 @@
 # graph provides functions to create and manipulate graphs, including adding nodes, edges, and calculating shortest paths.
 
-from collections import defaultdict, deque  
+from array import array
+from collections import OrderedDict, defaultdict, deque, namedtuple
+from heapq import heappop, heappush
+from itertools import count, repeat
+from multiprocessing import shared_memory
+import csv
+import json
+import math
+import os
+import sys
+import warnings
+
+import numpy as np
+
+
 class Graph:
-    def __init__(self):
+    def __init__(self, compact=False):
+        """
+        Create an empty graph.
+
+        With compact=True node labels are mapped to dense integer IDs and edges are
+        buffered as integer pairs; freeze() then packs the adjacency into CSR arrays
+        (offsets plus neighbors) that bfs and shortest_path run over.
+
+        Edge weights are only stored once an edge with a weight other than 1 is
+        added; until then every edge weighs 1.
+        """
         self.graph = defaultdict(list)
+        self.weights = defaultdict(list)
+        self.weighted = False
+        self.directed = False
+        self.compact = compact
+        self.node_ids = {}
+        self.labels = []
+        self.offsets = None
+        self.neighbors = None
+        self.edge_weights = None
+        self._sources = array('q')
+        self._targets = array('q')
+        self._weights = array('d')
+
+    @property
+    def frozen(self):
+        """True once the adjacency has been packed into CSR arrays."""
+        return self.offsets is not None
 
     def add_node(self, node):
         """Add a node to the graph."""
+        if self.compact:
+            return self._node_id(node)
         if node not in self.graph:
             self.graph[node] = []
 
-    def add_edge(self, node1, node2):
-        """Add an edge between two nodes."""
+    def add_edge(self, node1, node2, weight=1, directed=False):
+        """Add an edge between two nodes (only from node1 to node2 if directed)."""
+        # Validate before touching any state, so a rejected edge leaves the graph as it was
+        if self.compact and self.frozen:
+            raise RuntimeError("Cannot add nodes or edges to a frozen graph.")
+        if weight < 0:
+            raise ValueError("Edge weights must be non-negative.")
+        if weight != 1 and not self.weighted:
+            self._store_weights()
+        self.directed = self.directed or directed
+
+        if self.compact:
+            id1, id2 = self._node_id(node1), self._node_id(node2)
+            self._sources.append(id1)
+            self._targets.append(id2)
+            if not directed:
+                self._sources.append(id2)
+                self._targets.append(id1)
+            if self.weighted:
+                self._weights.extend([weight] if directed else [weight, weight])
+            return
         self.add_node(node1)
         self.add_node(node2)
         self.graph[node1].append(node2)
-        self.graph[node2].append(node1)
+        if self.weighted:
+            self.weights[node1].append(weight)
+        if not directed:
+            self.graph[node2].append(node1)
+            if self.weighted:
+                self.weights[node2].append(weight)
+
+    def _store_weights(self):
+        """Start recording weights, giving every existing edge weight 1."""
+        self.weighted = True
+        if self.compact:
+            self._weights = array('d', repeat(1.0, len(self._sources)))
+        else:
+            for node, neighbors in self.graph.items():
+                self.weights[node] = [1] * len(neighbors)
+
+    def _node_id(self, node):
+        """Return the integer ID of a node, assigning a new one if needed."""
+        node_id = self.node_ids.get(node)
+        if node_id is None:
+            if self.frozen:
+                raise RuntimeError("Cannot add nodes or edges to a frozen graph.")
+            node_id = len(self.labels)
+            self.node_ids[node] = node_id
+            self.labels.append(node)
+        return node_id
+
+    def freeze(self):
+        """Pack the buffered edges of a compact graph into CSR arrays."""
+        if not self.compact:
+            raise RuntimeError("Only compact graphs can be frozen.")
+        if self.frozen:
+            return
+        sources = np.frombuffer(self._sources, dtype=np.int64)
+        targets = np.frombuffer(self._targets, dtype=np.int64)
+        weights = np.frombuffer(self._weights, dtype=np.float64) if self.weighted else None
+        # Both directions of undirected edges are already buffered
+        self.offsets, self.neighbors, self.edge_weights = csr_from_edges(
+            sources, targets, len(self.labels), weights=weights, directed=True)
+        self._sources = array('q')
+        self._targets = array('q')
+        self._weights = array('d')
+
+    @classmethod
+    def load_edge_list(cls, file_path, delimiter=None, comments='#', skip_header=0, directed=False):
+        """
+        Build a frozen compact graph from a text file with one edge per line.
+
+        Each line holds two node labels and an optional weight, separated by
+        whitespace (or delimiter). Labels that all parse as integers become ints.
+        """
+        with warnings.catch_warnings():
+            # NumPy warns about comment-only lines, which are expected here
+            warnings.simplefilter('ignore', UserWarning)
+            rows = np.loadtxt(file_path, dtype=str, comments=comments, delimiter=delimiter,
+                              skiprows=skip_header, ndmin=2)
+        return cls._from_label_columns(rows, directed)
+
+    @classmethod
+    def load_csv(cls, file_path, source='source', target='target', weight=None, directed=False):
+        """
+        Build a frozen compact graph from a CSV file with a header row.
+
+        source, target and weight name the columns (or give their indices); the
+        weight column is optional.
+        """
+        with open(file_path, 'r', newline='') as file:
+            header = next(csv.reader(file), [])
+        columns = [source, target] + ([] if weight is None else [weight])
+        usecols = [column if isinstance(column, int) else header.index(column) for column in columns]
+        rows = np.loadtxt(file_path, dtype=str, delimiter=',', skiprows=1, usecols=usecols,
+                          quotechar='"', ndmin=2)
+        return cls._from_label_columns(rows, directed)
+
+    @classmethod
+    def _from_label_columns(cls, rows, directed):
+        """Map (source, target[, weight]) string columns to dense IDs and pack them into CSR."""
+        endpoints = rows[:, :2]
+        try:
+            endpoints = endpoints.astype(np.int64)
+        except ValueError:
+            pass
+        weights = rows[:, 2].astype(np.float64) if rows.shape[1] > 2 else None
+
+        # Number nodes in order of first appearance, as add_edge would
+        unique, first, inverse = np.unique(endpoints.ravel(), return_index=True, return_inverse=True)
+        order = np.argsort(first, kind='stable')
+        rank = np.empty_like(order)
+        rank[order] = np.arange(order.size)
+        ids = rank[inverse.ravel()].reshape(-1, 2)
+
+        graph = cls(compact=True)
+        graph.labels = unique[order].tolist()
+        graph.node_ids = {label: i for i, label in enumerate(graph.labels)}
+        graph._set_csr(ids[:, 0], ids[:, 1], weights, directed)
+        return graph
+
+    @classmethod
+    def load_binary(cls, file_path, dtype=np.int64, directed=False):
+        """
+        Build a frozen compact graph from a binary file of (source, target) integer pairs.
+
+        The file is memory-mapped rather than parsed. Node IDs must be dense
+        (0..n-1) and are used as labels. If a metadata file written by save_binary
+        sits next to it (file_path + '.json'), its dtype, labels, weights and
+        direction are used instead of the arguments.
+        """
+        meta_path = file_path + '.json'
+        meta = None
+        if os.path.exists(meta_path):
+            with open(meta_path, 'r') as file:
+                meta = json.load(file)
+            dtype = np.dtype(meta['dtype'])
+            directed = True  # snapshots store every half-edge
+        dtype = np.dtype(dtype)
+        if os.path.getsize(file_path) == 0:
+            pairs = np.empty((0, 2), dtype=dtype)
+        else:
+            pairs = np.memmap(file_path, dtype=dtype, mode='r').reshape(-1, 2)
+
+        weights = None
+        if meta is not None and meta['weighted']:
+            weights = np.memmap(file_path + '.weights', dtype=np.float64, mode='r') if pairs.size else np.empty(0)
+        num_nodes = meta['num_nodes'] if meta is not None else (int(pairs.max()) + 1 if pairs.size else 0)
+
+        graph = cls(compact=True)
+        if meta is not None and meta['labels'] is not None:
+            graph.labels = meta['labels']
+            graph.node_ids = {label: i for i, label in enumerate(graph.labels)}
+        else:
+            graph.labels = range(num_nodes)
+            graph.node_ids = DenseIndex(num_nodes)
+        graph._set_csr(pairs[:, 0], pairs[:, 1], weights, directed)
+        if meta is not None:
+            graph.directed = meta['directed']
+        return graph
+
+    def save_binary(self, file_path, dtype=np.int64):
+        """
+        Snapshot a compact graph as binary int32/int64 pairs for load_binary.
+
+        Every stored half-edge is written in CSR order, so reloading reproduces the
+        adjacency exactly. Labels (if not already 0..n-1) go to file_path + '.json'
+        and must be JSON-serializable; weights go to file_path + '.weights'.
+        """
+        if not self.compact:
+            raise RuntimeError("Only compact graphs can be saved in binary form.")
+        self.freeze()
+        dtype = np.dtype(dtype)
+        if len(self.labels) and len(self.labels) - 1 > np.iinfo(dtype).max:
+            raise ValueError(f"Too many nodes for {dtype.name} IDs.")
+        sources = np.repeat(np.arange(len(self.labels), dtype=dtype), np.diff(self.offsets))
+        np.column_stack((sources, self.neighbors.astype(dtype))).tofile(file_path)
+        if self.edge_weights is not None:
+            self.edge_weights.astype(np.float64).tofile(file_path + '.weights')
+        meta = {
+            'dtype': dtype.name,
+            'num_nodes': len(self.labels),
+            'directed': self.directed,
+            'weighted': self.edge_weights is not None,
+            'labels': None if isinstance(self.labels, range) else list(self.labels),
+        }
+        with open(file_path + '.json', 'w') as file:
+            json.dump(meta, file)
+
+    def _set_csr(self, sources, targets, weights, directed):
+        """Install CSR arrays built from endpoint ID arrays, marking the graph frozen."""
+        self.offsets, self.neighbors, self.edge_weights = csr_from_edges(
+            np.asarray(sources, dtype=np.int64), np.asarray(targets, dtype=np.int64),
+            len(self.labels), weights=weights, directed=directed)
+        self.directed = directed
+        self.weighted = weights is not None
+
+    def get_neighbors(self, node):
+        """Return the neighbors of a node in insertion order."""
+        if not self.compact:
+            return list(self.graph[node])
+        self.freeze()
+        node_id = self.node_ids[node]
+        return [self.labels[i] for i in self.neighbors[self.offsets[node_id]:self.offsets[node_id + 1]].tolist()]
 
     def bfs(self, start):
         """Perform BFS traversal from a starting node."""
+        if self.compact:
+            self.freeze()
+            if start not in self.node_ids:
+                return [start]
+            order, _ = csr_bfs(self.offsets, self.neighbors, self.node_ids[start])
+            labels = self.labels
+            return [labels[i] for i in order.tolist()]
+
         visited = set()
         queue = deque([start])
         traversal_order = []
@@ -32,27 +281,723 @@ class Graph:
 
         return traversal_order
 
-    def shortest_path(self, start, end):
-        """Find the shortest path between two nodes using BFS."""
+    def shortest_path(self, start, end, bidirectional=False):
+        """
+        Find the shortest path between two nodes using BFS.
+
+        Paths are rebuilt from parent pointers once the end is reached. With
+        bidirectional=True the search grows from both ends, always expanding the
+        smaller frontier, and stops when the two searches meet; graphs with
+        directed edges always use the one-sided search.
+        """
         if start == end:
             return [start]
 
-        visited = {start}
-        queue = deque([(start, [start])])
+        if self.compact:
+            self.freeze()
+            if start not in self.node_ids or end not in self.node_ids:
+                return None
+            source, target = self.node_ids[start], self.node_ids[end]
+            if bidirectional and not self.directed:
+                path = csr_bidirectional_path(self.offsets, self.neighbors, source, target)
+                return None if path is None else [self.labels[i] for i in path]
+            _, parents = csr_bfs(self.offsets, self.neighbors, source, target)
+            if parents[target] < 0:
+                return None
+            return [self.labels[i] for i in reversed(trace_parents(parents, target))]
+
+        if bidirectional and not self.directed:
+            return self._bidirectional_path(start, end)
+
+        parents = {start: None}
+        queue = deque([start])
 
         while queue:
-            current_node, path = queue.popleft()
+            current_node = queue.popleft()
 
-            for neighbor in self.graph[current_node]:
-                if neighbor not in visited:
-                    visited.add(neighbor)
-                    new_path = path + [neighbor]
+            for neighbor in self.graph.get(current_node, ()):
+                if neighbor not in parents:
+                    parents[neighbor] = current_node
                     if neighbor == end:
-                        return new_path
-                    queue.append((neighbor, new_path))
+                        return self._trace_path(parents, end)[::-1]
+                    queue.append(neighbor)
 
         return None  # No path found
 
+    def _bidirectional_path(self, start, end):
+        """Meet-in-the-middle BFS over the adjacency lists."""
+        if start not in self.graph or end not in self.graph:
+            return None
+        parents = [{start: None}, {end: None}]
+        depths = [{start: 0}, {end: 0}]
+        frontiers = [[start], [end]]
+
+        while frontiers[0] and frontiers[1]:
+            side = 0 if len(frontiers[0]) <= len(frontiers[1]) else 1
+            own_parents, own_depths = parents[side], depths[side]
+            other_depths = depths[1 - side]
+            best = None
+            next_frontier = []
+
+            # Expand a whole level so the shortest of its meeting points is kept
+            for node in frontiers[side]:
+                depth = own_depths[node] + 1
+                for neighbor in self.graph[node]:
+                    if neighbor in other_depths:
+                        length = depth + other_depths[neighbor]
+                        if best is None or length < best[0]:
+                            best = (length, node, neighbor)
+                    if neighbor not in own_parents:
+                        own_parents[neighbor] = node
+                        own_depths[neighbor] = depth
+                        next_frontier.append(neighbor)
+
+            if best is not None:
+                _, node, neighbor = best
+                forward_node, backward_node = (node, neighbor) if side == 0 else (neighbor, node)
+                return self._trace_path(parents[0], forward_node)[::-1] + self._trace_path(parents[1], backward_node)
+            frontiers[side] = next_frontier
+
+        return None  # No path found
+
+    def multi_source_bfs(self, sources):
+        """
+        Run one BFS whose first frontier holds every source node.
+
+        Returns (distances, nearest) dictionaries: the hop count from each reached
+        node to its closest source, and which source that is (ties go to the
+        source listed first).
+        """
+        sources = list(dict.fromkeys(sources))
+        if self.compact:
+            self.freeze()
+            ids = [self.node_ids[source] for source in sources if source in self.node_ids]
+            _, depths, origins = csr_multi_source_bfs(self.offsets, self.neighbors, ids)
+            labels = self.labels
+            reached = np.flatnonzero(depths >= 0).tolist()
+            distances = {labels[i]: int(depths[i]) for i in reached}
+            nearest = {labels[i]: labels[origins[i]] for i in reached}
+            for source in sources:
+                if source not in self.node_ids:
+                    distances[source] = 0
+                    nearest[source] = source
+            return distances, nearest
+
+        _, distances, nearest = self._multi_source_search(sources)
+        return distances, nearest
+
+    def _multi_source_search(self, sources):
+        """BFS over the adjacency lists from several roots; returns (parents, depths, origins)."""
+        parents = {source: None for source in sources}
+        depths = {source: 0 for source in sources}
+        origins = {source: source for source in sources}
+        queue = deque(parents)
+
+        while queue:
+            node = queue.popleft()
+            depth = depths[node] + 1
+            for neighbor in self.graph.get(node, ()):
+                if neighbor not in parents:
+                    parents[neighbor] = node
+                    depths[neighbor] = depth
+                    origins[neighbor] = origins[node]
+                    queue.append(neighbor)
+
+        return parents, depths, origins
+
+    def dijkstra(self, start, end=None):
+        """
+        Compute weighted shortest-path distances from a node using a binary-heap frontier.
+
+        Returns (distances, parents) dictionaries covering every node reached. If end
+        is given the search stops once it is settled, and only its distance (and
+        those of nodes settled before it) are final.
+        """
+        return self._weighted_search(start, end, None)
+
+    def weighted_shortest_path(self, start, end, heuristic=None):
+        """
+        Find the cheapest path between two nodes with Dijkstra, or A* if a heuristic is given.
+
+        heuristic(node, end) must never overestimate the remaining cost and should be
+        consistent. Returns (path, cost), or (None, math.inf) if end is unreachable.
+        """
+        distances, parents = self._weighted_search(start, end, heuristic)
+        if end not in distances:
+            return None, math.inf
+        return self._trace_path(parents, end)[::-1], distances[end]
+
+    def _weighted_search(self, start, end, heuristic):
+        """Dijkstra/A* over the adjacency lists with lazy deletion of stale heap entries."""
+        if self.compact:
+            return self._csr_weighted_search(start, end, heuristic)
+
+        distances = {start: 0}
+        parents = {start: None}
+        settled = set()
+        tiebreak = count()
+        heap = [(heuristic(start, end) if heuristic else 0, next(tiebreak), start)]
+
+        while heap:
+            node = heappop(heap)[2]
+            if node in settled:
+                continue
+            settled.add(node)
+            if node == end:
+                break
+            base = distances[node]
+            weights = self.weights[node] if self.weighted else repeat(1)
+            for neighbor, weight in zip(self.graph.get(node, ()), weights):
+                candidate = base + weight
+                if candidate < distances.get(neighbor, math.inf):
+                    distances[neighbor] = candidate
+                    parents[neighbor] = node
+                    priority = candidate + heuristic(neighbor, end) if heuristic else candidate
+                    heappush(heap, (priority, next(tiebreak), neighbor))
+
+        return distances, parents
+
+    def _csr_weighted_search(self, start, end, heuristic):
+        """Dijkstra/A* over the CSR arrays; heap entries hold integer node IDs."""
+        self.freeze()
+        if start not in self.node_ids:
+            return {start: 0}, {start: None}
+        labels, offsets, neighbors = self.labels, self.offsets, self.neighbors
+        edge_weights = self.edge_weights
+        source = self.node_ids[start]
+        target = self.node_ids.get(end, -1)
+
+        distances = [math.inf] * len(labels)
+        parents = [-1] * len(labels)
+        settled = bytearray(len(labels))
+        distances[source] = 0
+        parents[source] = source
+        heap = [(heuristic(start, end) if heuristic else 0, source)]
+
+        while heap:
+            node = heappop(heap)[1]
+            if settled[node]:
+                continue
+            settled[node] = 1
+            if node == target:
+                break
+            base = distances[node]
+            lo, hi = int(offsets[node]), int(offsets[node + 1])
+            weights = edge_weights[lo:hi].tolist() if edge_weights is not None else repeat(1)
+            for neighbor, weight in zip(neighbors[lo:hi].tolist(), weights):
+                candidate = base + weight
+                if candidate < distances[neighbor]:
+                    distances[neighbor] = candidate
+                    parents[neighbor] = node
+                    priority = candidate + heuristic(labels[neighbor], end) if heuristic else candidate
+                    heappush(heap, (priority, neighbor))
+
+        reached = [i for i, parent in enumerate(parents) if parent >= 0]
+        return ({labels[i]: distances[i] for i in reached},
+                {labels[i]: None if i == source else labels[parents[i]] for i in reached})
+
+    def connected_components(self):
+        """
+        Group the nodes into connected components using union-find.
+
+        Edge direction is ignored, so directed graphs yield weakly connected
+        components. Components are listed in the order their first node was added.
+        """
+        if self.compact:
+            self.freeze()
+            labels = self.labels
+            sources = np.repeat(np.arange(len(labels)), np.diff(self.offsets))
+            targets = self.neighbors
+            if not self.directed:
+                # Both halves of every undirected edge are stored; one is enough
+                keep = sources < targets
+                sources, targets = sources[keep], targets[keep]
+            edges = zip(sources.tolist(), targets.tolist())
+        else:
+            labels = list(self.graph)
+            ids = {node: i for i, node in enumerate(labels)}
+            edges = ((ids[node], ids[neighbor]) for node in labels for neighbor in self.graph[node])
+
+        components = UnionFind(len(labels))
+        for node1, node2 in edges:
+            components.union(node1, node2)
+
+        groups = {}
+        for node_id, label in enumerate(labels):
+            groups.setdefault(components.find(node_id), []).append(label)
+        return list(groups.values())
+
+    def parallel_bfs(self, start, workers=None, min_chunk=8192):
+        """
+        Perform BFS traversal from a starting node, expanding large frontiers in worker processes.
+
+        Only compact graphs are supported (RuntimeError otherwise); they are frozen
+        first if needed. Returns the same order as bfs(); see csr_parallel_bfs for
+        how the work is split.
+        """
+        if not self.compact:
+            raise RuntimeError("Parallel BFS requires a compact graph.")
+        self.freeze()
+        if start not in self.node_ids:
+            return [start]
+        order, _ = csr_parallel_bfs(self.offsets, self.neighbors, self.node_ids[start], workers, min_chunk)
+        labels = self.labels
+        return [labels[i] for i in order.tolist()]
+
+    @staticmethod
+    def _trace_path(parents, node):
+        """Follow parent pointers from a node back to the root of the search."""
+        path = []
+        while node is not None:
+            path.append(node)
+            node = parents[node]
+        return path
+
+
+class DenseIndex:
+    """
+    Label-to-ID mapping for graphs whose labels already are the IDs 0..size-1.
+    """
+
+    def __init__(self, size):
+        self.size = size
+
+    def __len__(self):
+        return self.size
+
+    def __contains__(self, label):
+        return isinstance(label, (int, np.integer)) and 0 <= label < self.size
+
+    def __getitem__(self, label):
+        if label not in self:
+            raise KeyError(label)
+        return int(label)
+
+    def get(self, label, default=None):
+        return int(label) if label in self else default
+
+
+class UnionFind:
+    """
+    Disjoint-set forest over the integers 0..size-1 with path compression and union by rank.
+    """
+
+    def __init__(self, size=0):
+        self.parent = list(range(size))
+        self.rank = [0] * size
+
+    def add(self):
+        """Add a new singleton set and return its element."""
+        self.parent.append(len(self.parent))
+        self.rank.append(0)
+        return len(self.parent) - 1
+
+    def find(self, element):
+        """Return the representative of the set containing element."""
+        parent = self.parent
+        root = element
+        while parent[root] != root:
+            root = parent[root]
+        # Point every node on the walked path straight at the root
+        while parent[element] != root:
+            parent[element], element = root, parent[element]
+        return root
+
+    def union(self, element1, element2):
+        """Merge the sets containing two elements; return False if they were already joined."""
+        root1, root2 = self.find(element1), self.find(element2)
+        if root1 == root2:
+            return False
+        rank = self.rank
+        if rank[root1] < rank[root2]:
+            root1, root2 = root2, root1
+        self.parent[root2] = root1
+        if rank[root1] == rank[root2]:
+            rank[root1] += 1
+        return True
+
+
+PathCacheInfo = namedtuple('PathCacheInfo', ['hits', 'misses', 'evictions', 'sources', 'bytes'])
+
+
+class ShortestPathService:
+    """
+    Answer many unweighted shortest-path queries against a graph that no longer changes.
+
+    Each source is searched once and its parent/depth tables are kept in an LRU
+    cache bounded both by number of sources and by total bytes, so any number of
+    targets for a hot source are answered without another BFS. Call clear() after
+    mutating a non-compact graph.
+    """
+
+    def __init__(self, graph, max_sources=128, max_bytes=256 * 1024 * 1024):
+        self.graph = graph
+        self.max_sources = max_sources
+        self.max_bytes = max_bytes
+        self._cache = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        if graph.compact:
+            graph.freeze()
+
+    def search(self, source):
+        """Return the (parents, depths) tables of a BFS from source, using the cache."""
+        entry = self._cache.get(source)
+        if entry is not None:
+            self.hits += 1
+            self._cache.move_to_end(source)
+            return entry[0], entry[1]
+
+        self.misses += 1
+        graph = self.graph
+        if graph.compact:
+            node_id = graph.node_ids.get(source)
+            roots = [] if node_id is None else [node_id]
+            parents, depths, _ = csr_multi_source_bfs(graph.offsets, graph.neighbors, roots)
+            size = parents.nbytes + depths.nbytes
+        else:
+            parents, depths, _ = graph._multi_source_search([source])
+            size = _dict_bytes(parents) + _dict_bytes(depths)
+
+        if size <= self.max_bytes and self.max_sources > 0:
+            self._cache[source] = (parents, depths, size)
+            self._bytes += size
+            while len(self._cache) > self.max_sources or self._bytes > self.max_bytes:
+                _, (_, _, evicted_size) = self._cache.popitem(last=False)
+                self._bytes -= evicted_size
+                self.evictions += 1
+        return parents, depths
+
+    def distance(self, start, end):
+        """Return the number of hops from start to end, or None if end is unreachable."""
+        if start == end:
+            return 0
+        _, depths = self.search(start)
+        if self.graph.compact:
+            node_id = self.graph.node_ids.get(end)
+            if node_id is None or depths[node_id] < 0:
+                return None
+            return int(depths[node_id])
+        return depths.get(end)
+
+    def shortest_path(self, start, end):
+        """Find a shortest path between two nodes from the cached BFS of start."""
+        if start == end:
+            return [start]
+        parents, depths = self.search(start)
+        return self._path_from(parents, depths, start, end)
+
+    def _path_from(self, parents, depths, start, end):
+        """Build the path from start to end out of the BFS tables of start."""
+        if start == end:
+            return [start]
+        graph = self.graph
+        if graph.compact:
+            node_id = graph.node_ids.get(end)
+            if node_id is None or depths[node_id] < 0:
+                return None
+            return [graph.labels[i] for i in reversed(trace_parents(parents, node_id))]
+        if end not in parents:
+            return None
+        return graph._trace_path(parents, end)[::-1]
+
+    def shortest_paths(self, pairs):
+        """
+        Answer a batch of (start, end) queries, running at most one BFS per distinct start.
+
+        Returns the paths in the order the pairs were given.
+        """
+        pairs = list(pairs)
+        by_source = defaultdict(list)
+        for index, (start, _) in enumerate(pairs):
+            by_source[start].append(index)
+
+        results = [None] * len(pairs)
+        for start, indices in by_source.items():
+            if all(pairs[index][1] == start for index in indices):
+                for index in indices:
+                    results[index] = [start]
+                continue
+            # One lookup per start, so the group is answered even when the search is too big to cache
+            parents, depths = self.search(start)
+            for index in indices:
+                results[index] = self._path_from(parents, depths, start, pairs[index][1])
+        return results
+
+    def cache_info(self):
+        """Return hit, miss and eviction counts plus the current cache size."""
+        return PathCacheInfo(self.hits, self.misses, self.evictions, len(self._cache), self._bytes)
+
+    def clear(self):
+        """Drop every cached search and reset the statistics."""
+        self._cache.clear()
+        self._bytes = 0
+        self.hits = self.misses = self.evictions = 0
+
+
+def _dict_bytes(mapping):
+    """
+    Estimate the memory held by a dictionary, counting its keys and values.
+    Labels are shared with the graph, so this is an upper bound.
+    """
+    return sys.getsizeof(mapping) + sum(sys.getsizeof(key) + sys.getsizeof(value)
+                                        for key, value in mapping.items())
+
+
+def csr_from_edges(sources, targets, num_nodes, weights=None, directed=False):
+    """
+    Build CSR adjacency arrays from parallel arrays of edge endpoints.
+
+    Neighbors of each node keep the order in which their edges were added.
+
+    :param sources: Integer array of first endpoints.
+    :param targets: Integer array of second endpoints.
+    :param num_nodes: Number of nodes (IDs are 0..num_nodes-1).
+    :param weights: Optional array of edge weights.
+    :param directed: If False, every edge is stored in both directions.
+    :return: Tuple (offsets, neighbors, edge_weights); node i's neighbors are
+        neighbors[offsets[i]:offsets[i + 1]] and edge_weights is None without weights.
+    """
+    dtype = np.int32 if num_nodes < 2 ** 31 else np.int64
+    if not directed:
+        # Interleave both directions so the stable sort keeps insertion order per node
+        sources, targets = (np.column_stack((sources, targets)).ravel(),
+                            np.column_stack((targets, sources)).ravel())
+        if weights is not None:
+            weights = np.repeat(weights, 2)
+    if sources.size and np.all(sources[:-1] <= sources[1:]):
+        # Already grouped by source (e.g. a saved snapshot); no sort needed
+        neighbors = np.asarray(targets, dtype=dtype)
+        edge_weights = None if weights is None else np.asarray(weights, dtype=np.float64)
+    else:
+        order = np.argsort(sources, kind='stable')
+        neighbors = targets[order].astype(dtype)
+        edge_weights = None if weights is None else np.asarray(weights, dtype=np.float64)[order]
+    offsets = np.zeros(num_nodes + 1, dtype=np.int64)
+    np.cumsum(np.bincount(sources, minlength=num_nodes), out=offsets[1:])
+    return offsets, neighbors, edge_weights
+
+
+def gather_neighbors(offsets, neighbors, frontier):
+    """
+    Concatenate the CSR neighbor lists of every node in a frontier, in frontier order.
+
+    :param offsets: CSR offsets array.
+    :param neighbors: CSR neighbors array.
+    :param frontier: Integer array of node IDs.
+    :return: Tuple (found, owners) where owners[k] is the frontier node that found[k] came from.
+    """
+    starts = offsets[frontier]
+    lengths = offsets[frontier + 1] - starts
+    total = int(lengths.sum())
+    if total == 0:
+        empty = np.empty(0, dtype=neighbors.dtype)
+        return empty, empty
+    # Index of each gathered slot: its list start plus its position within the list
+    positions = np.arange(total, dtype=np.int64) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+    found = neighbors[np.repeat(starts, lengths) + positions]
+    owners = np.repeat(frontier, lengths)
+    return found, owners
+
+
+def csr_bfs(offsets, neighbors, source, target=None):
+    """
+    Level-synchronous BFS over CSR arrays, visiting nodes in the same order as a FIFO queue.
+
+    :param offsets: CSR offsets array.
+    :param neighbors: CSR neighbors array.
+    :param source: Node ID to start from.
+    :param target: Optional node ID; the search stops after the level that reaches it.
+    :return: Tuple (order, parents); parents[source] == source and unreached nodes have -1.
+    """
+    num_nodes = len(offsets) - 1
+    parents = np.full(num_nodes, -1, dtype=neighbors.dtype)
+    parents[source] = source
+    frontier = np.array([source], dtype=neighbors.dtype)
+    levels = [frontier]
+    while frontier.size and (target is None or parents[target] < 0):
+        frontier, owners = _expand_frontier(offsets, neighbors, parents, frontier)
+        parents[frontier] = owners
+        levels.append(frontier)
+    return np.concatenate(levels), parents
+
+
+def csr_multi_source_bfs(offsets, neighbors, sources):
+    """
+    Level-synchronous BFS over CSR arrays from a frontier seeded with several nodes.
+
+    :param offsets: CSR offsets array.
+    :param neighbors: CSR neighbors array.
+    :param sources: Node IDs of the roots; roots are their own parents.
+    :return: Tuple (parents, depths, origins); unreached nodes have -1 in all three and
+        origins holds the root each node was reached from (the earlier root on ties).
+    """
+    num_nodes = len(offsets) - 1
+    parents = np.full(num_nodes, -1, dtype=neighbors.dtype)
+    depths = np.full(num_nodes, -1, dtype=np.int32)
+    origins = np.full(num_nodes, -1, dtype=neighbors.dtype)
+    frontier = np.asarray(list(dict.fromkeys(sources)), dtype=neighbors.dtype)
+    parents[frontier] = frontier
+    depths[frontier] = 0
+    origins[frontier] = frontier
+    depth = 0
+    while frontier.size:
+        depth += 1
+        frontier, owners = _expand_frontier(offsets, neighbors, parents, frontier)
+        parents[frontier] = owners
+        depths[frontier] = depth
+        origins[frontier] = origins[owners]
+    return parents, depths, origins
+
+
+def csr_parallel_bfs(offsets, neighbors, source, workers=None, min_chunk=8192):
+    """
+    Level-synchronous BFS whose large frontiers are split across a process pool.
+
+    The CSR arrays and the parent array live in shared memory, so workers attach
+    to them once instead of receiving pickled copies. Each worker gathers the
+    unvisited neighbors of its slice of the frontier; the parent process merges
+    the slices in frontier order, so the visit order matches csr_bfs. Frontiers
+    smaller than two chunks are expanded in the parent process.
+
+    :param offsets: CSR offsets array.
+    :param neighbors: CSR neighbors array.
+    :param source: Node ID to start from.
+    :param workers: Number of worker processes (defaults to os.cpu_count()).
+    :param min_chunk: Minimum number of frontier nodes handed to one task.
+    :return: Tuple (order, parents) as returned by csr_bfs.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    workers = workers or os.cpu_count() or 1
+    num_nodes = len(offsets) - 1
+    blocks = []
+    try:
+        shared = {}
+        for key, template in (('offsets', offsets), ('neighbors', neighbors),
+                              ('parents', np.empty(num_nodes, dtype=neighbors.dtype))):
+            block = shared_memory.SharedMemory(create=True, size=max(template.nbytes, 1))
+            blocks.append(block)
+            shared[key] = np.ndarray(template.shape, dtype=template.dtype, buffer=block.buf)
+            if key != 'parents':
+                shared[key][:] = template
+        specs = {key: (block.name, array.dtype.str, array.shape)
+                 for (key, array), block in zip(shared.items(), blocks)}
+
+        parents = shared['parents']
+        parents.fill(-1)
+        parents[source] = source
+        frontier = np.array([source], dtype=neighbors.dtype)
+        levels = [frontier]
+
+        with ProcessPoolExecutor(max_workers=workers, initializer=_attach_bfs_worker,
+                                 initargs=(specs,)) as executor:
+            while frontier.size:
+                if frontier.size < 2 * min_chunk or workers == 1:
+                    frontier, owners = _expand_frontier(offsets, neighbors, parents, frontier)
+                else:
+                    pieces = min(workers * 4, frontier.size // min_chunk)
+                    results = list(executor.map(_expand_frontier_chunk, np.array_split(frontier, pieces)))
+                    # Slices can discover the same node; the earliest slice wins, as in csr_bfs
+                    frontier, owners = _first_fresh(parents,
+                                                    np.concatenate([found for found, _ in results]),
+                                                    np.concatenate([owners for _, owners in results]))
+                parents[frontier] = owners
+                levels.append(frontier)
+
+        return np.concatenate(levels), parents.copy()
+    finally:
+        for block in blocks:
+            block.close()
+            block.unlink()
+
+
+def _expand_frontier(offsets, neighbors, parents, frontier):
+    """Gather the not-yet-visited neighbors of a frontier, first discovery of each only."""
+    return _first_fresh(parents, *gather_neighbors(offsets, neighbors, frontier))
+
+
+def _first_fresh(parents, found, owners):
+    """Drop visited nodes from gathered neighbors and keep the first discovery of each, in discovery order."""
+    fresh = parents[found] < 0
+    found, owners = found[fresh], owners[fresh]
+    _, first = np.unique(found, return_index=True)
+    first.sort()
+    return found[first], owners[first]
+
+
+_bfs_worker_arrays = {}
+
+
+def _attach_bfs_worker(specs):
+    """Process pool initializer: map the shared CSR and parent arrays into this worker."""
+    for key, (name, dtype, shape) in specs.items():
+        block = shared_memory.SharedMemory(name=name)
+        _bfs_worker_arrays[key] = (block, np.ndarray(shape, dtype=dtype, buffer=block.buf))
+
+
+def _expand_frontier_chunk(frontier):
+    """Process pool task: expand one slice of the frontier against the shared arrays."""
+    arrays = {key: array for key, (_, array) in _bfs_worker_arrays.items()}
+    return _expand_frontier(arrays['offsets'], arrays['neighbors'], arrays['parents'], frontier)
+
+
+def csr_bidirectional_path(offsets, neighbors, source, target):
+    """
+    Meet-in-the-middle BFS over CSR arrays, expanding the smaller frontier one level at a time.
+
+    :param offsets: CSR offsets array.
+    :param neighbors: CSR neighbors array.
+    :param source: Node ID to start from.
+    :param target: Node ID to reach.
+    :return: List of node IDs from source to target, or None if they are not connected.
+    """
+    if source == target:
+        return [source]
+    num_nodes = len(offsets) - 1
+    parents = [np.full(num_nodes, -1, dtype=neighbors.dtype) for _ in range(2)]
+    depths = [np.full(num_nodes, -1, dtype=np.int32) for _ in range(2)]
+    frontiers = [np.array([source], dtype=neighbors.dtype), np.array([target], dtype=neighbors.dtype)]
+    for side, root in enumerate((source, target)):
+        parents[side][root] = root
+        depths[side][root] = 0
+
+    while frontiers[0].size and frontiers[1].size:
+        side = 0 if frontiers[0].size <= frontiers[1].size else 1
+        found, owners = gather_neighbors(offsets, neighbors, frontiers[side])
+
+        meets = depths[1 - side][found] >= 0
+        if meets.any():
+            found, owners = found[meets], owners[meets]
+            best = int(np.argmin(depths[side][owners] + depths[1 - side][found]))
+            node, neighbor = int(owners[best]), int(found[best])
+            forward_node, backward_node = (node, neighbor) if side == 0 else (neighbor, node)
+            return trace_parents(parents[0], forward_node)[::-1] + trace_parents(parents[1], backward_node)
+
+        frontier, owners = _first_fresh(parents[side], found, owners)
+        parents[side][frontier] = owners
+        depths[side][frontier] = depths[side][owners] + 1
+        frontiers[side] = frontier
+
+    return None
+
+
+def trace_parents(parents, node):
+    """
+    Follow a CSR parent array from a node back to the root of its search.
+
+    :param parents: Parent array where the root is its own parent.
+    :param node: Node ID to start from.
+    :return: List of node IDs from node to the root.
+    """
+    path = [int(node)]
+    while parents[path[-1]] != path[-1]:
+        path.append(int(parents[path[-1]]))
+    return path
+
+
 # Example usage:
 if __name__ == "__main__":
     g = Graph()
@@ -74,3 +1019,34 @@ if __name__ == "__main__":
     print("Shortest path from B to D:", g.shortest_path('B', 'D'))
     print("Shortest path from D to B:", g.shortest_path('D', 'B'))
     print("Shortest path from E to C:", g.shortest_path('E', 'C'))
+
+    # Compact mode: integer node IDs and CSR adjacency
+    cg = Graph(compact=True)
+    for node1, node2 in [('A', 'B'), ('A', 'C'), ('B', 'D'), ('C', 'D'), ('D', 'E')]:
+        cg.add_edge(node1, node2)
+    cg.freeze()
+    print("Compact BFS Traversal from A:", cg.bfs('A'))
+    print("Compact shortest path from A to E:", cg.shortest_path('A', 'E'))
+    print("Parallel BFS Traversal from A:", cg.parallel_bfs('A', workers=2, min_chunk=1))
+    print("Bidirectional shortest path from A to E:", g.shortest_path('A', 'E', bidirectional=True))
+
+    # Weighted and directed edges
+    wg = Graph()
+    wg.add_edge('A', 'B', 4)
+    wg.add_edge('A', 'C', 1)
+    wg.add_edge('C', 'B', 2)
+    wg.add_edge('B', 'D', 1)
+    wg.add_edge('D', 'E', 3, directed=True)
+    print("Dijkstra distances from A:", wg.dijkstra('A')[0])
+    print("Cheapest path from A to E:", wg.weighted_shortest_path('A', 'E'))
+    print("Cheapest path from E to A:", wg.weighted_shortest_path('E', 'A'))
+
+    # Batched queries and multi-source BFS
+    service = ShortestPathService(g)
+    print("Batched shortest paths:", service.shortest_paths([('A', 'E'), ('B', 'C'), ('A', 'D')]))
+    print("Path cache:", service.cache_info())
+    print("Nearest of B/E for each node:", g.multi_source_bfs(['B', 'E'])[1])
+
+    # Connected components
+    g.add_edge('X', 'Y')
+    print("Connected components:", g.connected_components())
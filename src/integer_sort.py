@@ -0,0 +1,142 @@
+# integer sort
+# This module sorts large amounts of integers (IDs, timestamps) and stably sorts
+# records keyed by integers, without comparing boxed Python objects.
+import numpy as np
+
+from numeric_sort import as_numeric_array, offsets_from, radix_sort_array
+
+# Radix digit widths: base 256 and base 65536
+RADIX_BITS = (8, 16)
+
+# Inputs at least this long use 16-bit digits unless told otherwise
+WIDE_RADIX_MIN_SIZE = 1 << 16
+
+
+def integer_sort(values, radix_bits=None):
+    """
+    Sort integers of any sign.
+
+    By default this is np.sort, whose SIMD kernels beat counting and radix sort
+    on plain values. Passing radix_bits forces an LSD radix sort instead, which
+    does a fixed number of linear passes set by the range [min, max].
+
+    :param values: List of ints or NumPy integer array.
+    :param radix_bits: Digit width of a radix sort, 8 or 16 (None uses np.sort).
+    :return: Sorted list, or a sorted NumPy array for NumPy input.
+    """
+    keys = _integer_array(values)
+    if keys is None:
+        return sorted(values)
+    if radix_bits is None or keys.size < 2:
+        result = np.sort(keys)
+    else:
+        result = radix_sort_array(keys, _radix_bits(radix_bits, keys.size))
+    return result if isinstance(values, np.ndarray) else result.tolist()
+
+
+def integer_argsort(keys, radix_bits=None):
+    """
+    Stable argsort of integer keys.
+
+    Keys are shifted by their minimum. When the offsets and the element indices
+    fit in 64 bits together, each key is packed with its index into one uint64
+    and the packed array is sorted once; the indices make every value unique, so
+    even an unstable sort gives the stable order. Otherwise, or when radix_bits
+    is given, an LSD radix sort reorders by one digit per pass. Extra memory is
+    O(n) either way.
+
+    :param keys: List of ints or NumPy integer array.
+    :param radix_bits: Digit width of the radix passes, 8 or 16 (None picks packing or a width by input size).
+    :return: NumPy array of indices that put the keys in order, equal keys keeping their input order.
+    """
+    array = _integer_array(keys)
+    if array is None:
+        raise TypeError("integer_argsort needs integers that fit in 64 bits.")
+    if array.size < 2:
+        return np.arange(array.size, dtype=np.intp)
+
+    min_val = int(array.min())
+    span = int(array.max()) - min_val
+    index_bits = (array.size - 1).bit_length()
+    if radix_bits is None and span.bit_length() + index_bits <= 64:
+        packed = offsets_from(array, min_val, np.uint64)
+        packed <<= np.uint64(index_bits)
+        packed |= np.arange(array.size, dtype=np.uint64)
+        packed.sort()
+        packed &= np.uint64((1 << index_bits) - 1)
+        return packed.astype(np.intp)
+
+    offsets = offsets_from(array, min_val, _unsigned_type(span))
+    order = None
+    bits = _radix_bits(radix_bits, array.size)
+    for shift in range(0, span.bit_length(), bits):
+        step = np.argsort(_digits(offsets, shift, bits), kind='stable')
+        offsets = offsets[step]
+        order = step if order is None else order[step]
+    return np.arange(array.size, dtype=np.intp) if order is None else order
+
+
+def sort_by_key(records, key, reverse=False, radix_bits=None):
+    """
+    Stably sort records by an integer key, like sorted(records, key=key) but
+    with the keys ordered by integer_argsort.
+
+    :param records: Sequence of records.
+    :param key: Function returning the integer sort key of a record; if any key is
+        not an int (or does not fit in 64 bits) the records are sorted with sorted().
+    :param reverse: If True, sort in descending order (equal keys still keep their input order).
+    :param radix_bits: Digit width of the radix passes, 8 or 16 (chosen by input size if None).
+    :return: List of the records in key order.
+    """
+    keys = [key(record) for record in records]
+    if set(map(type, keys)) != {int}:
+        # Floats, bools, strings and other keys would be truncated or rejected by int64
+        return sorted(records, key=key, reverse=reverse)
+    try:
+        array = np.array(keys, dtype=np.int64)
+    except OverflowError:
+        return sorted(records, key=key, reverse=reverse)
+    if reverse:
+        # Negate (in wrapping arithmetic) so a stable ascending sort gives descending keys
+        array = ~array
+    return [records[index] for index in integer_argsort(array, radix_bits).tolist()]
+
+
+def _integer_array(values):
+    """Return values as a NumPy integer array, or None if they are not all ints."""
+    array = as_numeric_array(values)
+    if array is None:
+        return np.array([], dtype=np.int64) if isinstance(values, (list, tuple)) and not values else None
+    return array if array.dtype.kind in 'iu' else None
+
+
+def _radix_bits(radix_bits, size):
+    """Validate the digit width, picking 16 bits for large inputs when none is given."""
+    if radix_bits is None:
+        return 16 if size >= WIDE_RADIX_MIN_SIZE else 8
+    if radix_bits not in RADIX_BITS:
+        raise ValueError(f"radix_bits must be one of {RADIX_BITS}, got {radix_bits}.")
+    return radix_bits
+
+
+def _unsigned_type(span):
+    """Return the narrowest unsigned dtype that holds every offset up to span."""
+    for dtype in (np.uint8, np.uint16, np.uint32):
+        if span <= np.iinfo(dtype).max:
+            return np.dtype(dtype)
+    return np.dtype(np.uint64)
+
+
+def _digits(offsets, shift, radix_bits):
+    """Extract the radix digit starting at bit shift; NumPy sorts 8/16-bit digits by counting."""
+    digits = offsets >> offsets.dtype.type(shift) if shift else offsets
+    return digits.astype(np.uint8 if radix_bits == 8 else np.uint16)
+
+
+# Example usage:
+if __name__ == "__main__":
+    event_ids = [1_700_000_042, 1_700_000_007, -3, 1_700_000_042, 12]
+    print("Integer Sort:", integer_sort(event_ids))
+    print("Integer Argsort:", integer_argsort(event_ids))
+    events = [('login', 1_700_000_042), ('logout', 1_700_000_007), ('login', 1_700_000_007)]
+    print("Events by timestamp:", sort_by_key(events, key=lambda event: event[1]))
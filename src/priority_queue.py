@@ -0,0 +1,375 @@
+# priority queue
+# This module provides array-backed binary min-heaps: BinaryHeap for plain values and
+# PriorityQueue for items with changeable priorities (decrease-key), which heapq lacks.
+# benchmark_heapq compares them with heapq; run the module with --benchmark.
+import argparse
+import heapq
+import random
+import time
+
+
+class BinaryHeap:
+    """
+    Min-heap of comparable values stored in a list, with the heapq operations as methods.
+
+    :param iterable: Initial values, heapified in O(n).
+    """
+
+    def __init__(self, iterable=()):
+        self._heap = list(iterable)
+        for pos in range(len(self._heap) // 2 - 1, -1, -1):
+            self._sift_down(pos)
+
+    def __len__(self):
+        return len(self._heap)
+
+    def __bool__(self):
+        return bool(self._heap)
+
+    def __repr__(self):
+        return f"BinaryHeap({self._heap!r})"
+
+    def peek(self):
+        """Return the smallest value without removing it."""
+        if not self._heap:
+            raise IndexError("peek from an empty heap")
+        return self._heap[0]
+
+    def push(self, value):
+        """Add a value."""
+        self._heap.append(value)
+        self._sift_up(len(self._heap) - 1)
+
+    def pop(self):
+        """Remove and return the smallest value."""
+        heap = self._heap
+        if not heap:
+            raise IndexError("pop from an empty heap")
+        last = heap.pop()
+        if not heap:
+            return last
+        smallest = heap[0]
+        heap[0] = last
+        self._sift_down(0)
+        return smallest
+
+    def pushpop(self, value):
+        """Push a value, then pop and return the smallest; faster than push() followed by pop()."""
+        heap = self._heap
+        if heap and heap[0] < value:
+            value, heap[0] = heap[0], value
+            self._sift_down(0)
+        return value
+
+    def heapreplace(self, value):
+        """Pop and return the smallest value, then push a new one; faster than pop() followed by push()."""
+        heap = self._heap
+        if not heap:
+            raise IndexError("heapreplace on an empty heap")
+        smallest = heap[0]
+        heap[0] = value
+        self._sift_down(0)
+        return smallest
+
+    def _sift_up(self, pos):
+        """Move the value at pos up until its parent is not larger."""
+        heap = self._heap
+        value = heap[pos]
+        while pos > 0:
+            parent = (pos - 1) >> 1
+            if not value < heap[parent]:
+                break
+            heap[pos] = heap[parent]
+            pos = parent
+        heap[pos] = value
+
+    def _sift_down(self, pos):
+        """Move the value at pos down until no child is smaller."""
+        heap = self._heap
+        n = len(heap)
+        value = heap[pos]
+        child = 2 * pos + 1
+        while child < n:
+            if child + 1 < n and heap[child + 1] < heap[child]:
+                child += 1
+            if not heap[child] < value:
+                break
+            heap[pos] = heap[child]
+            pos = child
+            child = 2 * pos + 1
+        heap[pos] = value
+
+
+class PriorityQueue:
+    """
+    Min-priority queue of distinct hashable items.
+
+    Priorities live in a list parallel to the items, and a dictionary maps every
+    item to its position, so an item's priority can be looked up, lowered,
+    raised or removed in O(log n) without the stale entries heapq needs. Items
+    with equal priorities come out in no particular order.
+
+    :param items: Initial (item, priority) pairs, heapified in O(n).
+    """
+
+    def __init__(self, items=()):
+        self._items = []
+        self._priorities = []
+        self._positions = {}
+        for item, priority in items:
+            if item in self._positions:
+                raise ValueError(f"{item!r} is already queued.")
+            self._positions[item] = len(self._items)
+            self._items.append(item)
+            self._priorities.append(priority)
+        for pos in range(len(self._items) // 2 - 1, -1, -1):
+            self._sift_down(pos)
+
+    def __len__(self):
+        return len(self._items)
+
+    def __bool__(self):
+        return bool(self._items)
+
+    def __contains__(self, item):
+        return item in self._positions
+
+    def __repr__(self):
+        return f"PriorityQueue({list(zip(self._items, self._priorities))!r})"
+
+    def priority(self, item):
+        """Return the priority of a queued item (KeyError if it is not queued)."""
+        return self._priorities[self._positions[item]]
+
+    def peek(self):
+        """Return the (item, priority) pair with the lowest priority without removing it."""
+        if not self._items:
+            raise IndexError("peek from an empty priority queue")
+        return self._items[0], self._priorities[0]
+
+    def push(self, item, priority):
+        """Add an item that is not queued yet."""
+        if item in self._positions:
+            raise ValueError(f"{item!r} is already queued.")
+        self._items.append(item)
+        self._priorities.append(priority)
+        self._sift_up(len(self._items) - 1)
+
+    def pop(self):
+        """Remove and return the (item, priority) pair with the lowest priority."""
+        if not self._items:
+            raise IndexError("pop from an empty priority queue")
+        return self._remove_at(0)
+
+    def pushpop(self, item, priority):
+        """Push an item, then pop and return the lowest (item, priority) pair."""
+        if item in self._positions:
+            raise ValueError(f"{item!r} is already queued.")
+        if not self._items or not self._priorities[0] < priority:
+            return item, priority
+        top = self._items[0], self._priorities[0]
+        del self._positions[top[0]]
+        self._items[0] = item
+        self._priorities[0] = priority
+        self._sift_down(0)
+        return top
+
+    def heapreplace(self, item, priority):
+        """Pop and return the lowest (item, priority) pair, then push a new item."""
+        if not self._items:
+            raise IndexError("heapreplace on an empty priority queue")
+        top = self._items[0], self._priorities[0]
+        if item in self._positions and item != top[0]:
+            raise ValueError(f"{item!r} is already queued.")
+        del self._positions[top[0]]
+        self._items[0] = item
+        self._priorities[0] = priority
+        self._sift_down(0)
+        return top
+
+    def decrease_key(self, item, priority):
+        """Lower the priority of a queued item."""
+        pos = self._positions[item]
+        if self._priorities[pos] < priority:
+            raise ValueError(f"New priority {priority!r} is higher than the current {self._priorities[pos]!r}.")
+        self._priorities[pos] = priority
+        self._sift_up(pos)
+
+    def update(self, item, priority):
+        """Set the priority of an item, pushing it if it is not queued."""
+        pos = self._positions.get(item)
+        if pos is None:
+            self.push(item, priority)
+            return
+        old = self._priorities[pos]
+        self._priorities[pos] = priority
+        if priority < old:
+            self._sift_up(pos)
+        else:
+            self._sift_down(pos)
+
+    def remove(self, item):
+        """Remove a queued item and return its priority."""
+        return self._remove_at(self._positions[item])[1]
+
+    def _remove_at(self, pos):
+        """Remove the entry at pos, refill the gap with the last entry and return the removed pair."""
+        items, priorities = self._items, self._priorities
+        removed = items[pos], priorities[pos]
+        del self._positions[removed[0]]
+        last_item, last_priority = items.pop(), priorities.pop()
+        if pos < len(items):
+            items[pos] = last_item
+            priorities[pos] = last_priority
+            self._positions[last_item] = pos
+            if pos > 0 and last_priority < priorities[(pos - 1) >> 1]:
+                self._sift_up(pos)
+            else:
+                self._sift_down(pos)
+        return removed
+
+    def _sift_up(self, pos):
+        """Move the entry at pos up until its parent's priority is not larger."""
+        items, priorities, positions = self._items, self._priorities, self._positions
+        item, priority = items[pos], priorities[pos]
+        while pos > 0:
+            parent = (pos - 1) >> 1
+            if not priority < priorities[parent]:
+                break
+            items[pos] = items[parent]
+            priorities[pos] = priorities[parent]
+            positions[items[pos]] = pos
+            pos = parent
+        items[pos] = item
+        priorities[pos] = priority
+        positions[item] = pos
+
+    def _sift_down(self, pos):
+        """Move the entry at pos down until no child has a smaller priority."""
+        items, priorities, positions = self._items, self._priorities, self._positions
+        n = len(items)
+        item, priority = items[pos], priorities[pos]
+        child = 2 * pos + 1
+        while child < n:
+            if child + 1 < n and priorities[child + 1] < priorities[child]:
+                child += 1
+            if not priorities[child] < priority:
+                break
+            items[pos] = items[child]
+            priorities[pos] = priorities[child]
+            positions[items[pos]] = pos
+            pos = child
+            child = 2 * pos + 1
+        items[pos] = item
+        priorities[pos] = priority
+        positions[item] = pos
+
+
+def benchmark_heapq(n=10 ** 5, repeat=3, seed=0):
+    """
+    Time BinaryHeap and PriorityQueue against heapq on the same inputs.
+
+    Cases: n pushes followed by n pops, heapifying n values, and Dijkstra on a
+    random graph with n nodes and 4n edges, using PriorityQueue.update as
+    decrease-key against heapq with lazy deletion of stale entries.
+
+    :param n: Input size.
+    :param repeat: Number of measurements per case; the best one is reported.
+    :param seed: Seed for the random inputs.
+    :return: Dictionary mapping each case to {'heapq': seconds, 'priority_queue': seconds}.
+    """
+    rng = random.Random(seed)
+    values = [rng.random() for _ in range(n)]
+    graph = [[] for _ in range(n)]
+    for _ in range(4 * n):
+        graph[rng.randrange(n)].append((rng.randrange(n), rng.random()))
+
+    def heapq_push_pop():
+        heap = []
+        for value in values:
+            heapq.heappush(heap, value)
+        return [heapq.heappop(heap) for _ in range(n)]
+
+    def binary_heap_push_pop():
+        heap = BinaryHeap()
+        for value in values:
+            heap.push(value)
+        return [heap.pop() for _ in range(n)]
+
+    def heapq_heapify():
+        heap = values.copy()
+        heapq.heapify(heap)
+        return heap[0]
+
+    def binary_heap_heapify():
+        return BinaryHeap(values).peek()
+
+    def heapq_dijkstra():
+        distances = {0: 0.0}
+        heap = [(0.0, 0)]
+        done = set()
+        while heap:
+            distance, node = heapq.heappop(heap)
+            if node in done:
+                continue
+            done.add(node)
+            for neighbor, weight in graph[node]:
+                candidate = distance + weight
+                if candidate < distances.get(neighbor, float('inf')):
+                    distances[neighbor] = candidate
+                    heapq.heappush(heap, (candidate, neighbor))
+        return distances
+
+    def priority_queue_dijkstra():
+        distances = {0: 0.0}
+        queue = PriorityQueue([(0, 0.0)])
+        while queue:
+            node, distance = queue.pop()
+            for neighbor, weight in graph[node]:
+                candidate = distance + weight
+                if candidate < distances.get(neighbor, float('inf')):
+                    distances[neighbor] = candidate
+                    queue.update(neighbor, candidate)
+        return distances
+
+    cases = {
+        'push_pop': (heapq_push_pop, binary_heap_push_pop),
+        'heapify': (heapq_heapify, binary_heap_heapify),
+        'dijkstra': (heapq_dijkstra, priority_queue_dijkstra),
+    }
+    results = {}
+    for case, (baseline, candidate) in cases.items():
+        if baseline() != candidate():
+            raise AssertionError(f"{case}: results differ from heapq.")
+        results[case] = {'heapq': _best_time(baseline, repeat), 'priority_queue': _best_time(candidate, repeat)}
+    return results
+
+
+def _best_time(function, repeat):
+    """Return the fastest of repeat calls of function, in seconds."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+# Example usage:
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Binary heap examples and a benchmark against heapq.")
+    parser.add_argument('--benchmark', action='store_true', help="Time the heaps against heapq")
+    parser.add_argument('--size', type=int, default=10 ** 5, help="Input size of the benchmark")
+    args = parser.parse_args()
+    if args.benchmark:
+        for case, times in benchmark_heapq(args.size).items():
+            print(f"{case}: heapq {times['heapq']:.3f}s, priority_queue {times['priority_queue']:.3f}s")
+    else:
+        heap = BinaryHeap([5, 3, 8, 1])
+        heap.push(2)
+        print("Heap pops:", [heap.pop() for _ in range(len(heap))])
+
+        tasks = PriorityQueue([('backup', 30), ('email', 10), ('report', 20)])
+        tasks.decrease_key('backup', 5)
+        tasks.update('report', 40)
+        print("Task order:", [tasks.pop() for _ in range(len(tasks))])
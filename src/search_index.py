@@ -0,0 +1,435 @@
+# search index
+# This module keeps a persistent trigram index of a directory of text files so that
+# repeated searches only read the lines that can possibly match.
+import os
+import re
+import sqlite3
+from array import array
+from collections import defaultdict
+
+import numpy as np
+
+from file_handling import get_file_stat
+from searching import (DEFAULT_EXTENSIONS, PatternSet, SearchMatch, compile_patterns, iter_directory_files,
+                       iter_file_matches)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    id INTEGER PRIMARY KEY,
+    path TEXT UNIQUE NOT NULL,
+    mtime REAL NOT NULL,
+    size INTEGER NOT NULL,
+    line_offsets BLOB NOT NULL
+);
+CREATE TABLE IF NOT EXISTS postings (
+    trigram TEXT NOT NULL,
+    file_id INTEGER NOT NULL,
+    lines BLOB NOT NULL,
+    PRIMARY KEY (trigram, file_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS postings_by_file ON postings (file_id);
+"""
+
+# Opening of a non-capturing group whose flags leave literals alone ('i' and 'x' change them)
+_PLAIN_GROUP = re.compile(r'\(\?[aLmsu-]*:')
+
+# Number of characters following the escape letters that take a fixed-length code
+_ESCAPE_PAYLOADS = {'x': 2, 'u': 4, 'U': 8}
+
+
+class SearchIndex:
+    """
+    On-disk trigram index of the text files in a directory, stored in SQLite.
+
+    For every file the index keeps the byte offset of each line and, for every
+    lower-cased trigram, the numbers of the lines containing it. A search derives
+    the trigrams any match must contain from the pattern, intersects their
+    postings and runs the regular expression only on the surviving lines.
+    Patterns without usable literals fall back to scanning the indexed files.
+
+    Call update() to pick up added, changed and deleted files; files are
+    re-indexed only when their modification time or size changed. Each search
+    also stats every indexed file and re-indexes and fully scans those that
+    changed since the last update, so edits show up without calling update();
+    added and deleted files are only picked up by update(). Lines are split on '\\n'.
+    """
+
+    def __init__(self, directory_path, index_path=None, extensions=DEFAULT_EXTENSIONS, include=None, exclude=None,
+                 encoding='utf-8'):
+        self.directory_path = directory_path
+        self.index_path = index_path or os.path.join(directory_path, '.search_index.db')
+        self.extensions = extensions
+        self.include = include
+        self.exclude = exclude
+        self.encoding = encoding
+        self.connection = sqlite3.connect(self.index_path)
+        self.connection.executescript(SCHEMA)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """Close the index database."""
+        self.connection.close()
+
+    def update(self):
+        """
+        Bring the index up to date with the directory.
+
+        :return: Tuple (indexed, removed) with the number of files (re)indexed and dropped.
+        """
+        known = {path: (file_id, mtime, size)
+                 for file_id, path, mtime, size in self.connection.execute("SELECT id, path, mtime, size FROM files")}
+        indexed = 0
+        for file_path in iter_directory_files(self.directory_path, self.extensions, self.include, self.exclude):
+            if os.path.abspath(file_path) == os.path.abspath(self.index_path):
+                continue
+            entry = known.pop(file_path, None)
+            mtime, size = _file_signature(file_path)
+            if entry is None or entry[1:] != (mtime, size):
+                self.index_file(file_path)
+                indexed += 1
+
+        with self.connection:
+            for file_id, _, _ in known.values():
+                self._remove_file(file_id)
+        return indexed, len(known)
+
+    def index_file(self, file_path):
+        """
+        (Re)index a single file.
+
+        :param file_path: Path to the text file.
+        """
+        mtime, size = _file_signature(file_path)
+        line_offsets = array('Q')
+        postings = defaultdict(lambda: array('I'))
+        position = 0
+        with open(file_path, 'rb') as file:
+            for line_index, raw_line in enumerate(file):
+                line_offsets.append(position)
+                position += len(raw_line)
+                text = raw_line.decode(self.encoding, errors='replace').rstrip('\r\n').lower()
+                for trigram in {text[i:i + 3] for i in range(len(text) - 2)}:
+                    postings[trigram].append(line_index)
+
+        with self.connection:
+            row = self.connection.execute("SELECT id FROM files WHERE path = ?", (file_path,)).fetchone()
+            if row is not None:
+                self._remove_file(row[0])
+            file_id = self.connection.execute(
+                "INSERT INTO files (path, mtime, size, line_offsets) VALUES (?, ?, ?, ?)",
+                (file_path, mtime, size, line_offsets.tobytes())).lastrowid
+            self.connection.executemany(
+                "INSERT INTO postings (trigram, file_id, lines) VALUES (?, ?, ?)",
+                ((trigram, file_id, lines.tobytes()) for trigram, lines in postings.items()))
+
+    def _remove_file(self, file_id):
+        """Delete a file and its postings (call inside a transaction)."""
+        self.connection.execute("DELETE FROM postings WHERE file_id = ?", (file_id,))
+        self.connection.execute("DELETE FROM files WHERE id = ?", (file_id,))
+
+    def search(self, patterns, flags=0):
+        """
+        Search the indexed files.
+
+        :param patterns: Pattern(s) to search for, see searching.compile_patterns.
+        :param flags: re flags used when compiling string patterns.
+        :return: Generator of SearchMatch(path, line_no, line) records, file by file.
+        """
+        regex = compile_patterns(patterns, flags)
+        branches = required_trigrams(regex)
+        files = {file_id: (path, mtime, size, offsets)
+                 for file_id, path, mtime, size, offsets in self.connection.execute(
+                     "SELECT id, path, mtime, size, line_offsets FROM files")}
+
+        if branches is None:
+            candidates = {file_id: None for file_id in files}
+        else:
+            candidates = {}
+            for trigrams in branches:
+                for file_id, lines in self._lines_with_all(trigrams).items():
+                    previous = candidates.get(file_id)
+                    candidates[file_id] = lines if previous is None else np.union1d(previous, lines)
+
+        # Every indexed file is checked, since a changed file can match whatever its old postings say
+        for file_id in sorted(files, key=lambda file_id: files[file_id][0]):
+            file_path, mtime, size, offsets = files[file_id]
+            try:
+                current = _file_signature(file_path)
+            except FileNotFoundError:
+                continue
+            if current != (mtime, size):
+                self.index_file(file_path)
+                yield from iter_file_matches(file_path, regex, encoding=self.encoding)
+            elif file_id not in candidates:
+                continue
+            elif candidates[file_id] is None:
+                yield from iter_file_matches(file_path, regex, encoding=self.encoding)
+            else:
+                yield from self._search_lines(file_path, regex, np.frombuffer(offsets, dtype=np.uint64),
+                                              candidates[file_id].tolist())
+
+    def search_in_directory(self, pattern, flags=0):
+        """
+        Indexed counterpart of searching.search_in_directory.
+
+        :param pattern: Regular expression pattern to search for.
+        :param flags: re flags used when compiling the pattern.
+        :return: Dictionary with file paths as keys and lists of matching lines as values.
+        """
+        results = {}
+        for match in self.search(pattern, flags):
+            results.setdefault(match.path, []).append(match.line.strip())
+        return results
+
+    def _lines_with_all(self, trigrams):
+        """Map file IDs to the line numbers that contain every given trigram."""
+        postings = []
+        for trigram in trigrams:
+            rows = self.connection.execute("SELECT file_id, lines FROM postings WHERE trigram = ?", (trigram,))
+            postings.append(dict(rows))
+            if not postings[-1]:
+                return {}
+
+        # Intersect starting from the trigram found in the fewest files
+        postings.sort(key=len)
+        result = {file_id: _line_numbers(lines) for file_id, lines in postings[0].items()}
+        for posting in postings[1:]:
+            result = {file_id: np.intersect1d(lines, _line_numbers(posting[file_id]), assume_unique=True)
+                      for file_id, lines in result.items() if file_id in posting}
+            result = {file_id: lines for file_id, lines in result.items() if lines.size}
+            if not result:
+                break
+        return result
+
+    def _search_lines(self, file_path, regex, offsets, line_indices):
+        """Read the given lines of a file by offset and yield those the pattern matches."""
+        search = regex.search
+        with open(file_path, 'rb') as file:
+            for line_index in line_indices:
+                file.seek(int(offsets[line_index]))
+                # Match '\r\n' lines like the text-mode searches, which translate newlines
+                line = file.readline().decode(self.encoding, errors='replace').rstrip('\r\n')
+                if search(line + '\n'):
+                    yield SearchMatch(file_path, line_index + 1, line)
+
+
+def required_trigrams(regex):
+    """
+    Work out which lower-cased trigrams a line must contain to match a pattern.
+
+    Only literal character runs outside classes, optional quantifiers and groups
+    are used, so the result is conservative; non-capturing groups without the
+    'i' or 'x' flags (such as those compile_patterns wraps patterns in) are
+    looked into.
+
+    :param regex: Compiled text pattern or PatternSet.
+    :return: List with one trigram set per top-level alternative (a line must
+        contain every trigram of at least one set), or None if some alternative
+        has no literal run of three or more characters.
+    """
+    if isinstance(regex, PatternSet):
+        branches = []
+        for pattern in regex.patterns:
+            pattern_branches = required_trigrams(pattern)
+            if pattern_branches is None:
+                return None
+            branches.extend(pattern_branches)
+        return branches
+    source = regex.pattern
+    if not isinstance(source, str) or regex.flags & re.VERBOSE:
+        return None
+    if regex.flags & re.IGNORECASE and not source.isascii():
+        return None
+
+    branches = []
+    for branch in _split_alternatives(source):
+        trigrams = set()
+        for run in _literal_runs(branch):
+            run = run.lower()
+            trigrams.update(run[i:i + 3] for i in range(len(run) - 2))
+        if not trigrams:
+            return None
+        branches.append(trigrams)
+    return branches
+
+
+def _split_alternatives(source):
+    """Split a pattern on its top-level '|' characters."""
+    branches = []
+    depth = 0
+    start = 0
+    i = 0
+    while i < len(source):
+        char = source[i]
+        if char == '\\':
+            i += 2
+            continue
+        if char == '[':
+            i = _skip_class(source, i)
+            continue
+        if char == '(':
+            depth += 1
+        elif char == ')':
+            depth -= 1
+        elif char == '|' and depth == 0:
+            branches.append(source[start:i])
+            start = i + 1
+        i += 1
+    branches.append(source[start:])
+    # Alternatives wrapped whole in a group, as compile_patterns builds them, are split further
+    result = []
+    for branch in branches:
+        body = _group_body(branch, 0)
+        if body is not None and _skip_group(branch, 0) == len(branch):
+            result.extend(_split_alternatives(body))
+        else:
+            result.append(branch)
+    return result
+
+
+def _group_body(source, i):
+    """Return the inside of the group starting at source[i] if it is a plain non-capturing group, else None."""
+    opening = _PLAIN_GROUP.match(source, i)
+    if opening is None:
+        return None
+    end = _skip_group(source, i)
+    if source[end - 1:end] != ')':
+        return None
+    return source[opening.end():end - 1]
+
+
+def _skip_class(source, i):
+    """Return the index just past the character class starting at source[i]."""
+    i += 1
+    if i < len(source) and source[i] == '^':
+        i += 1
+    if i < len(source) and source[i] == ']':
+        i += 1
+    while i < len(source) and source[i] != ']':
+        i += 2 if source[i] == '\\' else 1
+    return i + 1
+
+
+def _skip_group(source, i):
+    """Return the index just past the group starting at source[i]."""
+    depth = 0
+    while i < len(source):
+        char = source[i]
+        if char == '\\':
+            i += 2
+            continue
+        if char == '[':
+            i = _skip_class(source, i)
+            continue
+        if char == '(':
+            depth += 1
+        elif char == ')':
+            depth -= 1
+            if depth == 0:
+                return i + 1
+        i += 1
+    return i
+
+
+def _literal_runs(branch):
+    """Yield the runs of literal characters that every match of a branch must contain."""
+    run = []
+    i = 0
+    while i < len(branch):
+        char = branch[i]
+        literal = None
+        if char == '\\':
+            escaped = branch[i + 1:i + 2]
+            if escaped and not escaped.isalnum():
+                literal = escaped
+            i = _skip_escape(branch, i)
+        elif char == '[':
+            i = _skip_class(branch, i)
+        elif char == '(':
+            end = _skip_group(branch, i)
+            body = _group_body(branch, i)
+            if body is not None and branch[end:end + 1] not in ('*', '?', '{') and len(_split_alternatives(body)) == 1:
+                # A group that must match once contributes its own literal runs
+                if len(run) >= 3:
+                    yield ''.join(run)
+                run = []
+                yield from _literal_runs(body)
+                i = end
+                continue
+            i = end
+        elif char in '.^$':
+            i += 1
+        elif char in '*?{+':
+            # A quantifier: the preceding atom is optional or may repeat
+            if char != '+' and run:
+                run.pop()
+            if char == '{':
+                i = branch.find('}', i) + 1 or len(branch)
+            else:
+                i += 1
+            if branch[i:i + 1] in ('?', '+'):
+                i += 1
+            if len(run) >= 3:
+                yield ''.join(run)
+            run = []
+            continue
+        else:
+            literal = char
+            i += 1
+
+        if literal is not None:
+            run.append(literal)
+        else:
+            if len(run) >= 3:
+                yield ''.join(run)
+            run = []
+    if len(run) >= 3:
+        yield ''.join(run)
+
+
+def _skip_escape(source, i):
+    """Return the index just past the escape starting at source[i], including its payload."""
+    escaped = source[i + 1:i + 2]
+    if escaped in _ESCAPE_PAYLOADS:
+        return i + 2 + _ESCAPE_PAYLOADS[escaped]
+    if escaped == 'N' and source[i + 2:i + 3] == '{':
+        return source.find('}', i) + 1 or len(source)
+    if escaped.isdigit():
+        # Octal escapes and group references take up to three digits; swallowing an
+        # extra digit only drops a literal, which never makes the result wrong
+        end = i + 2
+        while end < min(i + 4, len(source)) and source[end].isdigit():
+            end += 1
+        return end
+    return i + 2
+
+
+def _line_numbers(blob):
+    """Decode a postings blob into a sorted array of line numbers."""
+    return np.frombuffer(blob, dtype=np.uint32)
+
+
+def _file_signature(file_path):
+    """Return (mtime, size) of a file, used to spot files that changed since indexing."""
+    record = get_file_stat(file_path)
+    return record.mtime, record.size
+
+
+# Example usage:
+if __name__ == "__main__":
+    directory_path = 'example_directory'
+    pattern = r'\bPython\b'
+    if not os.path.isdir(directory_path):
+        # The index database is stored inside the directory by default
+        print(f"Directory {directory_path} not found.")
+    else:
+        with SearchIndex(directory_path) as index:
+            indexed, removed = index.update()
+            print(f"Indexed {indexed} files, removed {removed} from {index.index_path}")
+            for match in index.search(pattern):
+                print(f"{match.path}:{match.line_no}: {match.line}")
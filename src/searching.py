@@ -1,6 +1,250 @@
 # searching module
 # This module provides functions to search for specific patterns in text files.
+import asyncio
+import codecs
+import locale
+import mmap
+import os
 import re
+from collections import namedtuple
+from fnmatch import fnmatch
+from itertools import islice
+
+# One matching line: the file it came from, its 1-based line number and its text
+SearchMatch = namedtuple('SearchMatch', ['path', 'line_no', 'line'])
+
+# File endings searched by default in directory searches
+DEFAULT_EXTENSIONS = ('.txt',)
+
+# Files larger than this many bytes are split into ranges for parallel searches
+CHUNK_SIZE = 64 * 1024 * 1024
+
+# Approximate number of bytes read per step by the async searches
+ASYNC_BLOCK_SIZE = 1024 * 1024
+
+# Encodings in which ASCII text is stored as the same single bytes
+ASCII_COMPATIBLE_ENCODINGS = {'utf-8', 'ascii', 'iso8859-1', 'cp1252'}
+
+# Pattern syntax whose meaning differs between str and bytes patterns (scoped
+# inline flags such as '(?i:...)' included), or that depends on where a line ends;
+# patterns using it take the text path
+_TEXT_ONLY_SYNTAX = re.compile(r'\\[wWdDsSBAZNnruUx0-9]|\[\^|[.$]|\(\?[aiLmsux-]')
+_REGEX_METACHARACTERS = set('.^$*+?{}[]\\|()')
+
+# Inline flags group at the start of a pattern, and the flags that can be scoped to a group
+_GLOBAL_FLAGS = re.compile(r'\(\?[aiLmsux]+\)')
+_SCOPED_FLAGS = ((re.ASCII, 'a'), (re.IGNORECASE, 'i'), (re.LOCALE, 'L'), (re.MULTILINE, 'm'),
+                 (re.DOTALL, 's'), (re.VERBOSE, 'x'))
+
+
+def compile_patterns(patterns, flags=0):
+    """
+    Compile one or more patterns into a single regular expression.
+    
+    Patterns without groups are joined into one alternation. If any pattern has
+    groups, joining would renumber them (breaking backreferences) or clash on
+    group names, so the patterns are kept apart in a PatternSet instead.
+    
+    :param patterns: Pattern string, compiled pattern, PatternSet, or iterable of patterns.
+    :param flags: re flags used when compiling string patterns.
+    :return: Compiled pattern or PatternSet matching any of the given patterns.
+    """
+    if isinstance(patterns, (re.Pattern, PatternSet)):
+        return patterns
+    if isinstance(patterns, (str, bytes)):
+        return re.compile(patterns, flags)
+    compiled = [p if isinstance(p, re.Pattern) else re.compile(p, flags) for p in patterns]
+    if len(compiled) == 1:
+        return compiled[0]
+    if any(regex.groups for regex in compiled):
+        return PatternSet(compiled)
+    # Each alternative keeps its own flags (including inline ones like '(?i)') as a scoped group
+    separator = '|' if isinstance(compiled[0].pattern, str) else b'|'
+    return re.compile(separator.join(_scoped_source(regex) for regex in compiled))
+
+
+class PatternSet:
+    """
+    Compiled patterns searched one after another; a string matches if any of them does.
+    
+    :param patterns: Iterable of compiled patterns.
+    """
+    
+    def __init__(self, patterns):
+        self.patterns = tuple(patterns)
+    
+    def __repr__(self):
+        return f"PatternSet({list(self.patterns)!r})"
+    
+    def search(self, string, *args):
+        """Return the match of the first pattern that matches the string, or None."""
+        for regex in self.patterns:
+            match = regex.search(string, *args)
+            if match:
+                return match
+        return None
+
+
+def _scoped_source(regex):
+    """Return the source of a compiled pattern wrapped in a group that applies its flags."""
+    source = regex.pattern
+    text = isinstance(source, str)
+    if not text:
+        source = source.decode('latin-1')
+    # Global inline flags such as '(?i)' may only appear at the start of a pattern
+    while True:
+        leading = _GLOBAL_FLAGS.match(source)
+        if leading is None:
+            break
+        source = source[leading.end():]
+    letters = ''.join(letter for flag, letter in _SCOPED_FLAGS if regex.flags & flag)
+    if regex.flags & re.VERBOSE:
+        # A trailing comment would otherwise swallow the closing parenthesis
+        source += '\n'
+    scoped = f'(?{letters}:{source})'
+    return scoped if text else scoped.encode('latin-1')
+
+
+def iter_line_matches(lines, patterns, path=None, flags=0):
+    """
+    Lazily search an iterable of lines.
+    
+    :param lines: Iterable of lines to search within.
+    :param patterns: Pattern(s) to search for, see compile_patterns.
+    :param path: Value reported as the path of each match.
+    :param flags: re flags used when compiling string patterns.
+    :return: Generator of SearchMatch(path, line_no, line) records.
+    """
+    search = compile_patterns(patterns, flags).search
+    for line_no, line in enumerate(lines, 1):
+        if search(line):
+            yield SearchMatch(path, line_no, line.rstrip('\r\n'))
+
+
+def iter_file_matches(file_path, patterns, flags=0, encoding=None, errors='replace', fast=True):
+    """
+    Lazily search a text file line by line in constant memory.
+    
+    If fast is True and the pattern allows it (see byte_searcher), the file is
+    memory-mapped and searched as bytes, and only lines around hits are decoded.
+    Lines are then split on '\\n' only.
+    
+    :param file_path: Path to the text file.
+    :param patterns: Pattern(s) to search for, see compile_patterns.
+    :param flags: re flags used when compiling string patterns.
+    :param encoding: Text encoding of the file (platform default if None).
+    :param errors: How undecodable bytes are handled.
+    :param fast: Whether the memory-mapped bytes search may be used.
+    :return: Generator of SearchMatch(path, line_no, line) records.
+    """
+    regex = compile_patterns(patterns, flags)
+    encoding = encoding or locale.getpreferredencoding(False)
+    searcher = byte_searcher(regex, encoding) if fast else None
+    if searcher is not None:
+        yield from _iter_mmap_matches(file_path, regex, searcher, encoding, errors)
+        return
+    with open(file_path, 'r', encoding=encoding, errors=errors) as file:
+        yield from iter_line_matches(file, regex, file_path)
+
+
+def byte_searcher(regex, encoding):
+    """
+    Build a bytes-level equivalent of a text pattern, if one is safe to use.
+    
+    Plain ASCII literals are searched with bytes.find. Literals wrapped in \\b
+    (such as r'\\bPython\\b') are also found with bytes.find, and other ASCII
+    patterns with a bytes regex; both then confirm each candidate line with the
+    original pattern. Patterns using Unicode-aware classes, '.', negated sets,
+    line-end anchors or case folding, and PatternSets, return None.
+    
+    :param regex: Compiled text pattern or PatternSet.
+    :param encoding: Encoding of the files to search.
+    :return: Tuple (needle, exact) where needle is bytes or a compiled bytes
+        pattern and exact says hits need no confirmation, or None.
+    """
+    if isinstance(regex, PatternSet):
+        return None
+    source = regex.pattern
+    if not isinstance(source, str) or not source or not source.isascii() or '\n' in source or '\r' in source:
+        return None
+    if codecs.lookup(encoding).name not in ASCII_COMPATIBLE_ENCODINGS:
+        return None
+    if regex.flags & (re.IGNORECASE | re.VERBOSE):
+        return None
+    if not _REGEX_METACHARACTERS.intersection(source):
+        return source.encode('ascii'), True
+    if _TEXT_ONLY_SYNTAX.search(source):
+        return None
+    literal = source.replace('\\b', '')
+    if literal and not _REGEX_METACHARACTERS.intersection(literal):
+        return literal.encode('ascii'), False
+    try:
+        return re.compile(source.encode('ascii'), re.MULTILINE), False
+    except re.error:
+        # Syntax valid only in str patterns stays on the text path
+        return None
+
+
+def _iter_mmap_matches(file_path, regex, searcher, encoding, errors):
+    """Search a memory-mapped file as bytes, decoding only the lines that contain hits."""
+    with open(file_path, 'rb') as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            return
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            needle, exact = searcher
+            literal = isinstance(needle, bytes)
+            size = len(buffer)
+            position = 0
+            line_no = 1
+            counted = 0
+            while position < size:
+                if literal:
+                    hit = buffer.find(needle, position)
+                else:
+                    found = needle.search(buffer, position)
+                    hit = found.start() if found else -1
+                if hit < 0:
+                    return
+                line_start = buffer.rfind(b'\n', position, hit) + 1 or position
+                line_end = buffer.find(b'\n', hit)
+                line_end = size if line_end < 0 else line_end
+                position = line_end + 1
+
+                line = buffer[line_start:line_end].decode(encoding, errors).rstrip('\r')
+                if not exact and not regex.search(line + '\n'):
+                    continue
+                line_no += _count_newlines(buffer, counted, line_start)
+                counted = line_start
+                yield SearchMatch(file_path, line_no, line)
+
+
+def _count_newlines(buffer, start, end, step=CHUNK_SIZE):
+    """Count b'\\n' bytes in buffer[start:end] without copying more than step bytes at a time."""
+    total = 0
+    for offset in range(start, end, step):
+        total += buffer[offset:min(end, offset + step)].count(b'\n')
+    return total
+
+
+def iter_files_matches(file_paths, patterns, flags=0, encoding=None, errors='replace'):
+    """
+    Lazily search several text files one after another, skipping missing ones.
+    
+    :param file_paths: Iterable of paths to text files.
+    :param patterns: Pattern(s) to search for, see compile_patterns.
+    :param flags: re flags used when compiling string patterns.
+    :param encoding: Text encoding of the files (platform default if None).
+    :param errors: How undecodable bytes are handled.
+    :return: Generator of SearchMatch(path, line_no, line) records.
+    """
+    regex = compile_patterns(patterns, flags)
+    for file_path in file_paths:
+        try:
+            yield from iter_file_matches(file_path, regex, encoding=encoding, errors=errors)
+        except FileNotFoundError:
+            print(f"File {file_path} not found.")
+
+
 def search_in_file(file_path, pattern):
     """
     Search for a specific pattern in a text file.
@@ -11,33 +255,304 @@ def search_in_file(file_path, pattern):
     """
     matches = []
     try:
-        with open(file_path, 'r') as file:
-            for line in file:
-                if re.search(pattern, line):
-                    matches.append(line.strip())
+        matches = [match.line.strip() for match in iter_file_matches(file_path, pattern, errors='strict')]
     except FileNotFoundError:
         print(f"File {file_path} not found.")
     return matches
 
-def search_in_directory(directory_path, pattern):
+def iter_directory_files(directory_path, extensions=DEFAULT_EXTENSIONS, include=None, exclude=None):
+    """
+    Walk a directory tree and yield the paths of the files to search.
+    
+    :param directory_path: Path to the directory to walk.
+    :param extensions: File name endings to keep, or None for every file.
+    :param include: Glob pattern(s); if given, a file's name or path relative to
+        directory_path must match one of them.
+    :param exclude: Glob pattern(s) of files to skip, matched the same way.
+    :return: Generator of full file paths.
+    """
+    extensions = tuple(extensions) if extensions else None
+    include = [include] if isinstance(include, str) else include
+    exclude = [exclude] if isinstance(exclude, str) else exclude
+    for root, _, files in os.walk(directory_path):
+        for file in files:
+            if extensions and not file.endswith(extensions):
+                continue
+            file_path = os.path.join(root, file)
+            relative_path = os.path.relpath(file_path, directory_path)
+            if include and not any(fnmatch(file, glob) or fnmatch(relative_path, glob) for glob in include):
+                continue
+            if exclude and any(fnmatch(file, glob) or fnmatch(relative_path, glob) for glob in exclude):
+                continue
+            yield file_path
+
+
+def search_in_directory(directory_path, pattern, extensions=DEFAULT_EXTENSIONS, include=None, exclude=None,
+                        workers=None):
     """
     Search for a specific pattern in all text files within a directory.
     
     :param directory_path: Path to the directory containing text files.
     :param pattern: Regular expression pattern to search for.
-    :return: Dictionary with file names as keys and lists of matching lines as values.
+    :param extensions: File name endings to search, or None for every file.
+    :param include: Glob pattern(s) a file must match to be searched.
+    :param exclude: Glob pattern(s) of files to skip.
+    :param workers: If given, search with a pool of this many processes.
+    :return: Dictionary with file paths as keys and lists of matching lines as values.
     """
-    import os
     results = {}
-    for root, _, files in os.walk(directory_path):
-        for file in files:
-            if file.endswith('.txt'):
-                file_path = os.path.join(root, file)
-                matches = search_in_file(file_path, pattern)
+    if workers:
+        for file_path, matches in iter_directory_matches(directory_path, pattern, extensions, include, exclude,
+                                                         workers=workers):
+            results[file_path] = [match.line.strip() for match in matches]
+        return results
+
+    for file_path in iter_directory_files(directory_path, extensions, include, exclude):
+        matches = search_in_file(file_path, pattern)
+        if matches:
+            results[file_path] = matches
+    return results
+
+
+def iter_directory_matches(directory_path, patterns, extensions=DEFAULT_EXTENSIONS, include=None, exclude=None,
+                           workers=None, chunk_size=CHUNK_SIZE, flags=0, encoding=None):
+    """
+    Search a directory tree with a process pool and stream back each file's matches as it finishes.
+    
+    Files larger than chunk_size are split into byte ranges searched in parallel;
+    their matches are reported once every range is done, with file-wide line
+    numbers. At most a few tasks per worker are queued at a time, so huge trees
+    are walked lazily.
+    
+    :param directory_path: Path to the directory to search.
+    :param patterns: Pattern(s) to search for, see compile_patterns.
+    :param extensions: File name endings to search, or None for every file.
+    :param include: Glob pattern(s) a file must match to be searched.
+    :param exclude: Glob pattern(s) of files to skip.
+    :param workers: Number of worker processes (defaults to os.cpu_count()).
+    :param chunk_size: Size in bytes of the ranges large files are split into.
+    :param flags: re flags used when compiling string patterns.
+    :param encoding: Text encoding of the files (platform default if None, as in iter_file_matches).
+    :return: Generator of (file_path, [SearchMatch, ...]) for files with matches, in completion order.
+    """
+    from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+    regex = compile_patterns(patterns, flags)
+    encoding = encoding or locale.getpreferredencoding(False)
+    workers = workers or os.cpu_count() or 1
+    tasks = _iter_search_tasks(iter_directory_files(directory_path, extensions, include, exclude), chunk_size)
+    pending = {}
+    chunks = {}
+
+    executor = ProcessPoolExecutor(max_workers=workers)
+    try:
+        while True:
+            for file_path, index, count, start, end in tasks:
+                future = executor.submit(_search_file_range, file_path, start, end, regex, encoding)
+                pending[future] = (file_path, index, count)
+                if len(pending) >= workers * 4:
+                    break
+            if not pending:
+                return
+
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                file_path, index, count = pending.pop(future)
+                try:
+                    result = future.result()
+                except OSError as error:
+                    print(f"File {file_path} could not be searched: {error}")
+                    result = None
+                parts = chunks.setdefault(file_path, [None] * count)
+                parts[index] = result if result is not None else (0, [])
+                if any(part is None for part in parts):
+                    continue
+                del chunks[file_path]
+
+                matches = []
+                line_offset = 0
+                for line_count, part_matches in parts:
+                    matches.extend(SearchMatch(file_path, line_offset + line_no, line) for line_no, line in part_matches)
+                    line_offset += line_count
                 if matches:
-                    results[file] = matches
+                    yield file_path, matches
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def _iter_search_tasks(file_paths, chunk_size):
+    """Split each file into (file_path, index, count, start, end) byte-range tasks."""
+    for file_path in file_paths:
+        try:
+            size = os.path.getsize(file_path)
+        except OSError:
+            continue
+        count = max(1, -(-size // chunk_size))
+        for index in range(count):
+            # The last range runs to end of file in case the file grew
+            end = None if index == count - 1 else (index + 1) * chunk_size
+            yield file_path, index, count, index * chunk_size, end
+
+
+def _search_file_range(file_path, start, end, regex, encoding):
+    """
+    Search the lines that begin inside the byte range [start, end) of a file.
+    
+    :return: Tuple (line_count, matches) where matches holds (line_no, line) pairs
+        numbered from 1 at the range's first line.
+    """
+    search = regex.search
+    matches = []
+    line_count = 0
+    with open(file_path, 'rb') as file:
+        if start:
+            # A line that straddles start belongs to the previous range
+            file.seek(start - 1)
+            if file.read(1) != b'\n':
+                file.readline()
+        position = file.tell()
+        for raw_line in file:
+            if end is not None and position >= end:
+                break
+            position += len(raw_line)
+            line_count += 1
+            # Match '\r\n' lines like the text-mode searches, which translate newlines
+            line = raw_line.decode(encoding, errors='replace').rstrip('\r\n')
+            if search(line + '\n'):
+                matches.append((line_count, line))
+    return line_count, matches
+
+
+async def aiter_file_matches(file_path, patterns, flags=0, encoding=None, errors='replace',
+                             block_size=ASYNC_BLOCK_SIZE):
+    """
+    Asynchronously search a text file, reading and matching blocks of lines in a worker thread.
+    
+    The event loop only waits between blocks, so cancelling the consumer stops
+    the search after at most one more block.
+    
+    :param file_path: Path to the text file.
+    :param patterns: Pattern(s) to search for, see compile_patterns.
+    :param flags: re flags used when compiling string patterns.
+    :param encoding: Text encoding of the file (platform default if None).
+    :param errors: How undecodable bytes are handled.
+    :param block_size: Approximate number of bytes read per step.
+    :return: Async generator of SearchMatch(path, line_no, line) records.
+    """
+    search = compile_patterns(patterns, flags).search
+    file = await asyncio.to_thread(open, file_path, 'r', encoding=encoding, errors=errors)
+    try:
+        line_offset = 0
+        while True:
+            line_count, matches = await asyncio.to_thread(_search_next_block, file, search, block_size)
+            if not line_count:
+                return
+            for line_no, line in matches:
+                yield SearchMatch(file_path, line_offset + line_no, line)
+            line_offset += line_count
+    finally:
+        file.close()
+
+
+def _search_next_block(file, search, block_size):
+    """Read the next block of lines from an open file and return (line_count, [(line_no, line), ...])."""
+    lines = file.readlines(block_size)
+    matches = [(line_no, line.rstrip('\r\n')) for line_no, line in enumerate(lines, 1) if search(line)]
+    return len(lines), matches
+
+
+async def async_search_in_file(file_path, pattern):
+    """
+    Async counterpart of search_in_file.
+    
+    :param file_path: Path to the text file.
+    :param pattern: Regular expression pattern to search for.
+    :return: List of lines containing the pattern.
+    """
+    try:
+        return [match.line.strip() async for match in aiter_file_matches(file_path, pattern, errors='strict')]
+    except FileNotFoundError:
+        print(f"File {file_path} not found.")
+        return []
+
+
+async def aiter_directory_matches(directory_path, patterns, extensions=DEFAULT_EXTENSIONS, include=None,
+                                  exclude=None, concurrency=16, semaphore=None, flags=0, encoding=None):
+    """
+    Asynchronously search a directory tree, streaming each file's matches as it finishes.
+    
+    The tree is walked lazily in a worker thread. At most concurrency files are
+    read at once; pass a shared asyncio.Semaphore to bound reads across several
+    searches instead. Closing or cancelling the consumer cancels the file
+    searches still in flight.
+    
+    :param directory_path: Path to the directory to search.
+    :param patterns: Pattern(s) to search for, see compile_patterns.
+    :param extensions: File name endings to search, or None for every file.
+    :param include: Glob pattern(s) a file must match to be searched.
+    :param exclude: Glob pattern(s) of files to skip.
+    :param concurrency: Maximum number of files searched at the same time.
+    :param semaphore: Optional asyncio.Semaphore limiting concurrent file reads.
+    :param flags: re flags used when compiling string patterns.
+    :param encoding: Text encoding of the files (platform default if None).
+    :return: Async generator of (file_path, [SearchMatch, ...]) for files with matches, in completion order.
+    """
+    regex = compile_patterns(patterns, flags)
+    semaphore = semaphore or asyncio.Semaphore(concurrency)
+    file_paths = iter_directory_files(directory_path, extensions, include, exclude)
+    walked = False
+    pending = set()
+    try:
+        while True:
+            if not walked and len(pending) < concurrency:
+                batch = await asyncio.to_thread(list, islice(file_paths, concurrency - len(pending)))
+                walked = not batch
+                pending.update(asyncio.create_task(_collect_file_matches(file_path, regex, encoding, semaphore))
+                               for file_path in batch)
+            if not pending:
+                return
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                file_path, matches = task.result()
+                if matches:
+                    yield file_path, matches
+    finally:
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+
+async def _collect_file_matches(file_path, regex, encoding, semaphore):
+    """Search one file under the semaphore and return (file_path, matches)."""
+    async with semaphore:
+        try:
+            return file_path, [match async for match in aiter_file_matches(file_path, regex, encoding=encoding)]
+        except OSError as error:
+            print(f"File {file_path} could not be searched: {error}")
+            return file_path, []
+
+
+async def async_search_in_directory(directory_path, pattern, extensions=DEFAULT_EXTENSIONS, include=None,
+                                    exclude=None, concurrency=16):
+    """
+    Async counterpart of search_in_directory.
+    
+    :param directory_path: Path to the directory containing text files.
+    :param pattern: Regular expression pattern to search for.
+    :param extensions: File name endings to search, or None for every file.
+    :param include: Glob pattern(s) a file must match to be searched.
+    :param exclude: Glob pattern(s) of files to skip.
+    :param concurrency: Maximum number of files searched at the same time.
+    :return: Dictionary with file paths as keys and lists of matching lines as values.
+    """
+    results = {}
+    async for file_path, matches in aiter_directory_matches(directory_path, pattern, extensions, include, exclude,
+                                                            concurrency):
+        results[file_path] = [match.line.strip() for match in matches]
     return results
 
+
 def search_in_string(text, pattern):
     """
     Search for a specific pattern in a string.
@@ -56,11 +571,7 @@ def search_in_lines(lines, pattern):
     :param pattern: Regular expression pattern to search for.
     :return: List of lines containing the pattern.
     """
-    matches = []
-    for line in lines:
-        if re.search(pattern, line):
-            matches.append(line.strip())
-    return matches
+    return [match.line.strip() for match in iter_line_matches(lines, pattern)]
 
 
 # Example usage:
@@ -74,6 +585,10 @@ if __name__ == "__main__":
         print(match)
 
     # Search for a pattern in all text files in a directory
+    # Stream matches for several patterns across files as they are found
+    for match in iter_files_matches([file_path], [pattern, r'\bJava\b']):
+        print(f"{match.path}:{match.line_no}: {match.line}")
+
     directory_path = 'example_directory'
     results = search_in_directory(directory_path, pattern)
     print(f"Matches in directory {directory_path}:")
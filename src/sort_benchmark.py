@@ -0,0 +1,282 @@
+# sort benchmark
+# This module times the sorts in basic_algorithms and sorting.sort_list across input
+# sizes and distributions and writes the results as JSON that can be diffed and
+# compared between releases.
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+from basic_algorithms import (bubble_sort, counting_sort, heap_sort, insertion_sort, merge_sort, quick_sort,
+                              selection_sort)
+from file_handling import read_json_file, write_json_file
+from sorting import sort_list
+
+SORTS = {
+    'bubble_sort': bubble_sort,
+    'selection_sort': selection_sort,
+    'insertion_sort': insertion_sort,
+    'quick_sort': quick_sort,
+    'merge_sort': merge_sort,
+    'heap_sort': heap_sort,
+    'counting_sort': lambda arr: counting_sort(arr, max(arr)),
+    'sort_list': sort_list,
+}
+
+# Sorts that take quadratic time, skipped above quadratic_limit
+QUADRATIC_SORTS = {'bubble_sort', 'selection_sort', 'insertion_sort'}
+
+# Sorts that do not compare elements, so have no comparison count; sort_list
+# sorts numbers with NumPy, and counting its sorted() fallback on wrapped
+# values would not describe the timed path
+NON_COMPARISON_SORTS = {'counting_sort', 'sort_list'}
+
+DEFAULT_SIZES = (10, 100, 1000, 10 ** 4, 10 ** 5, 10 ** 6, 10 ** 7)
+
+
+def random_data(n, rng):
+    return [rng.randrange(n) for _ in range(n)]
+
+
+def sorted_data(n, rng):
+    return list(range(n))
+
+
+def reversed_data(n, rng):
+    return list(range(n - 1, -1, -1))
+
+
+def few_unique_data(n, rng):
+    return [rng.randrange(10) for _ in range(n)]
+
+
+def organ_pipe_data(n, rng):
+    half = n // 2
+    return list(range(half)) + list(range(n - half - 1, -1, -1))
+
+
+DISTRIBUTIONS = {
+    'random': random_data,
+    'sorted': sorted_data,
+    'reversed': reversed_data,
+    'few_unique': few_unique_data,
+    'organ_pipe': organ_pipe_data,
+}
+
+
+class CountingKey:
+    """Wrapper around a value that counts every comparison made between wrapped values."""
+    __slots__ = ('value',)
+    comparisons = 0
+
+    def __init__(self, value):
+        self.value = value
+
+    def __lt__(self, other):
+        CountingKey.comparisons += 1
+        return self.value < other.value
+
+    def __le__(self, other):
+        CountingKey.comparisons += 1
+        return self.value <= other.value
+
+    def __gt__(self, other):
+        CountingKey.comparisons += 1
+        return self.value > other.value
+
+    def __ge__(self, other):
+        CountingKey.comparisons += 1
+        return self.value >= other.value
+
+    def __eq__(self, other):
+        CountingKey.comparisons += 1
+        return self.value == other.value
+
+    __hash__ = None
+
+
+def time_sort(sort, data, repeat=3, min_time=0.05):
+    """
+    Time a sort on fresh copies of the data.
+
+    :param sort: Sort function taking a list.
+    :param data: Input list (left untouched).
+    :param repeat: Number of measurements; the best one is reported.
+    :param min_time: Each measurement sorts enough copies to take at least this long.
+    :return: Best time per sort in seconds.
+    """
+    number = 1
+    while True:
+        elapsed = _time_copies(sort, data, number)
+        if elapsed >= min_time or number >= 1000:
+            break
+        number *= 10
+    best = elapsed
+    for _ in range(repeat - 1):
+        best = min(best, _time_copies(sort, data, number))
+    return best / number
+
+
+def _time_copies(sort, data, number):
+    copies = [data.copy() for _ in range(number)]
+    start = time.perf_counter()
+    for copy in copies:
+        sort(copy)
+    return time.perf_counter() - start
+
+
+def peak_memory(sort, data):
+    """
+    Measure the peak memory allocated while sorting a copy of the data.
+
+    :return: Peak traced allocation in bytes (the input copy itself is not counted).
+    """
+    copy = data.copy()
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        sort(copy)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def count_comparisons(sort, data):
+    """
+    Count the element comparisons a sort makes on the data.
+
+    :return: Number of comparisons.
+    """
+    wrapped = [CountingKey(value) for value in data]
+    CountingKey.comparisons = 0
+    sort(wrapped)
+    return CountingKey.comparisons
+
+
+def run_benchmarks(sorts=None, sizes=DEFAULT_SIZES, distributions=None, quadratic_limit=10 ** 4,
+                   count_limit=10 ** 5, memory_limit=10 ** 6, repeat=3, seed=0):
+    """
+    Benchmark sorts over every combination of size and distribution.
+
+    :param sorts: Names of the sorts to run (all of SORTS if None).
+    :param sizes: Input sizes.
+    :param distributions: Names of the input distributions (all of DISTRIBUTIONS if None).
+    :param quadratic_limit: Largest size the quadratic sorts are run on.
+    :param count_limit: Largest size comparisons are counted for.
+    :param memory_limit: Largest size peak memory is measured for (tracemalloc slows sorts down).
+    :param repeat: Number of timing measurements per case.
+    :param seed: Seed for the random distributions, so runs see the same inputs.
+    :return: Report dictionary with the environment and one result per case; a
+        case whose sort failed has its metrics set to None and the exception name in 'error'.
+    """
+    sorts = list(SORTS) if sorts is None else sorts
+    distributions = list(DISTRIBUTIONS) if distributions is None else distributions
+    results = []
+    for distribution in distributions:
+        for size in sizes:
+            data = DISTRIBUTIONS[distribution](size, random.Random(seed))
+            for name in sorts:
+                if name in QUADRATIC_SORTS and size > quadratic_limit:
+                    continue
+                sort = SORTS[name]
+                result = {'sort': name, 'distribution': distribution, 'size': size,
+                          'seconds': None, 'peak_bytes': None, 'comparisons': None, 'error': None}
+                try:
+                    result['seconds'] = time_sort(sort, data, repeat)
+                    if size <= memory_limit:
+                        result['peak_bytes'] = peak_memory(sort, data)
+                    if name not in NON_COMPARISON_SORTS and size <= count_limit:
+                        result['comparisons'] = count_comparisons(sort, data)
+                except RecursionError as e:
+                    # The recursive reference sorts overflow the stack on some inputs; record it as a result
+                    result['error'] = type(e).__name__
+                results.append(result)
+    return {
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'machine': platform.machine(),
+        'seed': seed,
+        'results': results,
+    }
+
+
+def compare_reports(baseline, current, threshold=1.25, min_seconds=1e-3, min_bytes=64 * 1024):
+    """
+    Find the cases that got slower, used more memory or made more comparisons.
+
+    :param baseline: Report from run_benchmarks (e.g. of the previous release).
+    :param current: Report to check.
+    :param threshold: Ratio above which time or memory counts as a regression;
+        any increase in comparisons counts.
+    :param min_seconds: Slowdowns smaller than this many seconds are timing noise and never count.
+    :param min_bytes: Memory increases smaller than this many bytes never count.
+    :return: List of (sort, distribution, size, metric, baseline value, current value) tuples.
+    """
+    previous = {(r['sort'], r['distribution'], r['size']): r for r in baseline['results']}
+    regressions = []
+    for result in current['results']:
+        case = (result['sort'], result['distribution'], result['size'])
+        old = previous.get(case)
+        if old is None:
+            continue
+        if result['error'] and not old['error']:
+            regressions.append(case + ('error', None, result['error']))
+        for metric, limit, floor in (('seconds', threshold, min_seconds), ('peak_bytes', threshold, min_bytes),
+                                     ('comparisons', 1, 0)):
+            if old[metric] is None or result[metric] is None:
+                continue
+            if result[metric] - old[metric] < floor:
+                continue
+            if result[metric] > old[metric] * limit:
+                regressions.append(case + (metric, old[metric], result[metric]))
+    return regressions
+
+
+def main(argv=None):
+    """
+    Command-line entry point: run the benchmarks, write the JSON report and
+    optionally check it against a baseline report.
+
+    :param argv: Argument list (defaults to sys.argv[1:])
+    :return: Process exit code (1 if regressions were found)
+    """
+    parser = argparse.ArgumentParser(description="Benchmark the sorting algorithms and report JSON.")
+    parser.add_argument('--sorts', nargs='+', choices=list(SORTS), help="Sorts to run (default: all)")
+    parser.add_argument('--sizes', nargs='+', type=int, default=list(DEFAULT_SIZES), help="Input sizes")
+    parser.add_argument('--distributions', nargs='+', choices=list(DISTRIBUTIONS),
+                        help="Input distributions (default: all)")
+    parser.add_argument('--quadratic-limit', type=int, default=10 ** 4, help="Largest size for quadratic sorts")
+    parser.add_argument('--count-limit', type=int, default=10 ** 5, help="Largest size to count comparisons for")
+    parser.add_argument('--memory-limit', type=int, default=10 ** 6, help="Largest size to measure memory for")
+    parser.add_argument('--repeat', type=int, default=3, help="Timing measurements per case")
+    parser.add_argument('--seed', type=int, default=0, help="Random seed for the input data")
+    parser.add_argument('--output', help="Write the report to this JSON file instead of stdout")
+    parser.add_argument('--baseline', help="Report to compare against; regressions are listed on stderr")
+    parser.add_argument('--threshold', type=float, default=1.25, help="Time/memory ratio counted as a regression")
+    parser.add_argument('--min-seconds', type=float, default=1e-3, help="Smallest slowdown in seconds that counts")
+    parser.add_argument('--min-bytes', type=int, default=64 * 1024, help="Smallest memory increase that counts")
+    args = parser.parse_args(argv)
+
+    report = run_benchmarks(args.sorts, args.sizes, args.distributions, args.quadratic_limit, args.count_limit,
+                            args.memory_limit, args.repeat, args.seed)
+    if args.output:
+        write_json_file(args.output, report)
+    else:
+        print(json.dumps(report, indent=4))
+
+    if args.baseline:
+        regressions = compare_reports(read_json_file(args.baseline), report, args.threshold, args.min_seconds,
+                                      args.min_bytes)
+        for sort, distribution, size, metric, old, new in regressions:
+            print(f"{sort} on {size} {distribution} items: {metric} {old} -> {new}", file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
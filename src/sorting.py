@@ -1,6 +1,8 @@
 # sorting 
 # functions for sorting lists, tuples, and dictionaries in Python
 from typing import List, Tuple, Dict, Any
+
+from numeric_sort import numeric_sort
 def sort_list(arr: List[Any], reverse: bool = False) -> List[Any]:
     """
     Sort a list in ascending or descending order.
@@ -9,7 +11,8 @@ def sort_list(arr: List[Any], reverse: bool = False) -> List[Any]:
     :param reverse: If True, sort in descending order; otherwise, sort in ascending order.
     :return: Sorted list.
     """
-    return sorted(arr, reverse=reverse)
+    # Lists of only ints or only floats are sorted with NumPy, anything else with sorted()
+    return numeric_sort(arr, reverse=reverse)
 
 def sort_tuple(tup: Tuple[Any, ...], reverse: bool = False) -> Tuple[Any, ...]:
     """